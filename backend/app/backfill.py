@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.core.http_client import http_client
+from app.core.job_scripts.page_cache import page_cache
+from app.core.job_scripts.patch_release import ingest_version
+from app.crud.patch import Patch
+from app.db import connect
+
+logger = logging.getLogger(__name__)
+
+
+async def list_versions() -> List[str]:
+    versions = await http_client.get_json('https://ddragon.leagueoflegends.com/api/versions.json')
+    return sorted(
+        {version[:-2] for version in versions if re.fullmatch(r'\d+\.\d+\.1', version)},
+        key=Patch.version_key
+    )
+
+
+def select_versions(
+        versions: List[str],
+        from_version: Optional[str],
+        to_version: Optional[str],
+        selected: Optional[List[str]]
+) -> List[str]:
+    if selected:
+        return [version for version in versions if version in selected]
+
+    return [
+        version for version in versions
+        if (from_version is None or Patch.version_key(version) >= Patch.version_key(from_version))
+        and (to_version is None or Patch.version_key(version) <= Patch.version_key(to_version))
+    ]
+
+
+async def is_ingested(version: str) -> bool:
+    try:
+        await Patch(version).get(['version'])
+    except HTTPException:
+        return False
+    return True
+
+
+async def backfill(versions: List[str], all_versions: List[str], workers: int) -> Dict[str, Dict[str, dict]]:
+    semaphore = asyncio.Semaphore(workers)
+    reports: Dict[str, Dict[str, dict]] = {}
+    finished: List[str] = []
+    start = time.perf_counter()
+
+    async def run(version: str) -> None:
+        index = all_versions.index(version)
+        previous = all_versions[index - 1] if index > 0 else None
+
+        async with semaphore:
+            if await is_ingested(version):
+                finished.append(version)
+                logger.info(f"[{len(finished)}/{len(versions)}] Patch {version} already ingested, skipping.")
+                return
+
+            version_start = time.perf_counter()
+            try:
+                reports[version] = await ingest_version(version, previous, reset_cache=False)
+            except Exception:
+                logger.exception(f"Patch {version} failed.")
+                reports[version] = {}
+
+        finished.append(version)
+        elapsed = time.perf_counter() - start
+        records = sum(stage['records'] or 0 for stage in reports[version].values())
+        failed = [name for name, stage in reports[version].items() if stage['status'] != 'done']
+        status = 'failed' if not reports[version] else f"failed stages {', '.join(failed)}" if failed else 'done'
+        logger.info(
+            f"[{len(finished)}/{len(versions)}] Patch {version}: {status} "
+            f"in {time.perf_counter() - version_start:.0f}s, {records} records. "
+            f"Throughput: {len(reports) / elapsed * 3600:.1f} patches/hour."
+        )
+
+    try:
+        await asyncio.gather(*(run(version) for version in versions))
+    finally:
+        logger.info(f"Page cache: {page_cache.stats()}")
+        page_cache.reset()
+
+    return reports
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Ingest a range of historical patches.')
+    parser.add_argument('--from', dest='from_version', help='Oldest version to ingest, e.g. 13.1.')
+    parser.add_argument('--to', dest='to_version', help='Newest version to ingest, e.g. 14.20.')
+    parser.add_argument('--versions', nargs='+', help='Explicit list of versions to ingest.')
+    parser.add_argument('--workers', type=int, default=4, help='Number of versions ingested concurrently.')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    connect()
+
+    try:
+        all_versions = await list_versions()
+        versions = select_versions(all_versions, args.from_version, args.to_version, args.versions)
+        logger.info(f"Backfilling {len(versions)} patches with {args.workers} workers.")
+
+        reports = await backfill(versions, all_versions, args.workers)
+    finally:
+        http_client.close()
+
+    failed = [version for version, report in reports.items() if report.get('patch', {}).get('status') != 'done']
+    logger.info(f"Backfill finished: {len(reports) - len(failed)} patches ingested, {len(failed)} failed.")
+    if failed:
+        logger.info(f"Failed patches: {', '.join(failed)}. Rerun to resume them.")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.serialization import dump_json
+
+SIZE_SAMPLE: int = 8
+
+
+class ReadCache:
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.__entries: OrderedDict = OrderedDict()
+        self.__max_entries: int = max_entries
+        self.__max_bytes: int = max_bytes
+        self.__bytes: int = 0
+        self.__lock = Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key(collection: str, patches: Optional[Iterable[str]], fields: Optional[List[str]] = None) -> tuple:
+        return (
+            collection,
+            tuple(patches) if patches is not None else None,
+            tuple(sorted(fields)) if fields else None
+        )
+
+    @staticmethod
+    def size(value: Any) -> int:
+        if isinstance(value, list) and len(value) > SIZE_SAMPLE:
+            sample = value[::len(value) // SIZE_SAMPLE]
+            return len(dump_json(sample)) * len(value) // len(sample)
+        return len(dump_json(value))
+
+    def get(self, key: tuple) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] < time.monotonic():
+                self.__bytes -= self.__entries.pop(key)[1]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: tuple, value: Any, size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        size = self.size(value) if size is None else size
+        if size > self.__max_bytes:
+            return
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__bytes -= self.__entries.pop(key)[1]
+
+            self.__entries[key] = (value, size, time.monotonic() + ttl if ttl is not None else None)
+            self.__bytes += size
+
+            while len(self.__entries) > self.__max_entries or self.__bytes > self.__max_bytes:
+                self.__bytes -= self.__entries.popitem(last=False)[1][1]
+
+    def invalidate(self, collection: str, patch: Optional[str] = None) -> None:
+        with self.__lock:
+            keys: List[Tuple] = [
+                key for key in self.__entries
+                if key[0] == collection and (patch is None or key[1] is None or patch in key[1])
+            ]
+            for key in keys:
+                self.__bytes -= self.__entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self.__entries),
+            'bytes': self.__bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+read_cache = ReadCache(settings.READ_CACHE_MAX_ENTRIES, settings.READ_CACHE_MAX_BYTES)
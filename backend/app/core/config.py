@@ -1,3 +1,5 @@
+from typing import Dict, Literal, Optional
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -30,8 +32,18 @@ class Settings(BaseSettings):
     API_V1: str = '/api/v1'
 
     JOB_RELEASE_PATCH: str = 'fb000ab5-ab68-43c9-8328-19f256d3b180'
+    LEADER_ELECTION: Literal['off', 'file', 'lease'] = 'file'
+    LEADER_LOCK_PATH: str = '.scheduler.lock'
+    LEADER_LEASE_TTL: float = 60
+    LEADER_RENEW_INTERVAL: float = 15
+
+    CERTIFICATE: Optional[CertificateSettings] = None
 
-    CERTIFICATE: CertificateSettings
+    STORAGE_BACKEND: Literal['firestore', 'sqlite'] = 'firestore'
+    SQLITE_PATH: str = 'riot_collector.sqlite3'
+    READ_REPLICA: bool = False
+    READ_REPLICA_PATH: str = 'replica.sqlite3'
+    READ_REPLICA_RETRY: float = 300
 
     CHAMPION_COLLECTION: str = 'champion'
     ITEM_COLLECTION: str = 'item'
@@ -39,6 +51,48 @@ class Settings(BaseSettings):
     PERKS_COLLECTION: str = 'perks'
     SUMMONER_SPELL_COLLECTION: str = 'summoner_spell'
     SHARD_COLLECTION: str = 'shard'
+    ETAG_COLLECTION: str = 'etag'
+    MANIFEST_COLLECTION: str = 'ingestion_manifest'
+    LEADER_COLLECTION: str = 'leader'
+
+    FIRESTORE_BATCH_SIZE: int = 500
+    PATCH_QUERY_CHUNK_SIZE: int = 30
+    DETERMINISTIC_IDS: bool = False
+    INCREMENTAL_INGESTION: bool = False
+    REFERENCE_CHUNK_SIZE: int = 100
+
+    READ_CACHE_MAX_ENTRIES: int = 256
+    READ_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    LAST_VERSION_TTL: float = 300
+    PATCH_LIST_TTL: float = 300
+
+    API_CACHE_CONTROL: str = 'public, max-age=31536000, immutable'
+    API_MAX_PAGE_SIZE: int = 1000
+    API_FAST_JSON: bool = True
+
+    SNAPSHOT_BUCKET: Optional[str] = None
+    SNAPSHOT_PREFIX: str = 'snapshots'
+
+    HTTP_TIMEOUT: float = 30
+    HTTP_RETRIES: int = 3
+    HTTP_POOL_SIZE: int = 16
+    HTTP_WORKERS: int = 32
+    HTTP_HOST_CONCURRENCY: int = 8
+    HTTP_HOST_RATE_LIMIT: float = 20
+    HTTP_HOST_RATE_LIMITS: Dict[str, float] = {'leagueoflegends.fandom.com': 10}
+    HTTP_CACHE_DIR: str = '.http_cache'
+    HTTP_CACHE_MODE: Literal['off', 'revalidate', 'cache-first', 'offline'] = 'off'
+
+    SCRAPER_CONCURRENCY: int = 8
+    SCRAPER_FAILURE_TOLERANCE: int = 5
+    STAGE_CONCURRENCY: int = 3
+    STAGE_RETRIES: int = 1
+    CHECKPOINT_SIZE: int = 20
+    INGESTION_WORKER: bool = True
+    INGESTION_PROGRESS_INTERVAL: float = 1
+
+    HTML_PARSER: Literal['auto', 'lxml', 'html.parser'] = 'auto'
+    HTML_PARSE_TARGETED: bool = True
 
 
 settings = Settings()
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpCache:
+    def __init__(self, directory: str) -> None:
+        self.__directory = Path(directory)
+
+    @staticmethod
+    def __write(path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'{path.name}.', suffix='.tmp', delete=False) as file:
+            file.write(content)
+        try:
+            os.replace(file.name, path)
+        except OSError:
+            os.unlink(file.name)
+            raise
+
+    def __index_path(self, url: str) -> Path:
+        return self.__directory / 'index' / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def __body_path(self, digest: str) -> Path:
+        return self.__directory / 'bodies' / digest[:2] / digest
+
+    def load(self, url: str) -> Optional[dict]:
+        try:
+            entry = json.loads(self.__index_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+
+        return entry if self.__body_path(entry['body']).exists() else None
+
+    def store(self, url: str, response: requests.Response) -> None:
+        digest = hashlib.sha256(response.content).hexdigest()
+        body_path = self.__body_path(digest)
+        if not body_path.exists():
+            self.__write(body_path, response.content)
+
+        self.__write(self.__index_path(url), json.dumps({
+            'url': url,
+            'body': digest,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'stored_at': time.time(),
+        }).encode())
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+        headers: dict = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def response(self, url: str, entry: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = entry.get('encoding')
+        response.headers = CaseInsensitiveDict({
+            k: v for k, v in {
+                'Content-Type': entry.get('content_type'),
+                'ETag': entry.get('etag'),
+                'Last-Modified': entry.get('last_modified'),
+            }.items() if v is not None
+        })
+        response._content = self.__body_path(entry['body']).read_bytes()
+        return response
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        entry = self.load(url)
+        return self.response(url, entry) if entry is not None else None
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.core.http_cache import HttpCache
+
+
+class HostLimiter:
+    def __init__(self, rate: float, concurrency: int) -> None:
+        self.__interval: float = 1 / rate if rate > 0 else 0
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__lock = asyncio.Lock()
+        self.__next_slot: float = 0
+
+    async def __aenter__(self) -> None:
+        await self.__semaphore.acquire()
+        try:
+            async with self.__lock:
+                now = time.monotonic()
+                delay = self.__next_slot - now
+                self.__next_slot = max(now, self.__next_slot) + self.__interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            self.__semaphore.release()
+            raise
+
+    async def __aexit__(self, *_) -> None:
+        self.__semaphore.release()
+
+
+class HttpClient:
+    def __init__(self) -> None:
+        self.__sessions: Dict[str, requests.Session] = {}
+        self.__limiters: Dict[str, HostLimiter] = {}
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__cache = HttpCache(settings.HTTP_CACHE_DIR)
+
+    def __get_session(self, host: str) -> requests.Session:
+        session = self.__sessions.get(host)
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.HTTP_POOL_SIZE,
+                max_retries=settings.HTTP_RETRIES
+            )
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self.__sessions[host] = session
+        return session
+
+    def __get_limiter(self, host: str) -> HostLimiter:
+        limiter = self.__limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                settings.HTTP_HOST_RATE_LIMITS.get(host, settings.HTTP_HOST_RATE_LIMIT),
+                settings.HTTP_HOST_CONCURRENCY
+            )
+            self.__limiters[host] = limiter
+        return limiter
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=settings.HTTP_WORKERS, thread_name_prefix='http-client'
+            )
+        return self.__executor
+
+    def __fetch(self, session: requests.Session, url: str) -> requests.Response:
+        if settings.HTTP_CACHE_MODE == 'off':
+            return session.get(url, timeout=settings.HTTP_TIMEOUT)
+
+        entry = self.__cache.load(url)
+        response = session.get(
+            url, headers=self.__cache.conditional_headers(entry), timeout=settings.HTTP_TIMEOUT
+        )
+        if response.status_code == 304 and entry is not None:
+            return self.__cache.response(url, entry)
+        if response.status_code == 200:
+            self.__cache.store(url, response)
+
+        return response
+
+    async def get(self, url: str) -> requests.Response:
+        loop = asyncio.get_running_loop()
+
+        if settings.HTTP_CACHE_MODE in ('cache-first', 'offline'):
+            response = await loop.run_in_executor(self.__get_executor(), self.__cache.get, url)
+            if response is not None:
+                return response
+            if settings.HTTP_CACHE_MODE == 'offline':
+                raise requests.ConnectionError(f"{url} is not in the HTTP cache.")
+
+        host = urlsplit(url).netloc
+        session = self.__get_session(host)
+        async with self.__get_limiter(host):
+            return await loop.run_in_executor(self.__get_executor(), partial(self.__fetch, session, url))
+
+    async def get_content(self, url: str) -> bytes:
+        return (await self.get(url)).content
+
+    async def get_json(self, url: str):
+        return (await self.get(url)).json()
+
+    def close(self) -> None:
+        for session in self.__sessions.values():
+            session.close()
+        self.__sessions.clear()
+        self.__limiters.clear()
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+
+http_client = HttpClient()
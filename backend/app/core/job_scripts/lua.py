@@ -0,0 +1,178 @@
+import re
+from typing import Any, Iterator, List, Tuple
+
+TOKEN = re.compile(
+    r'(?:\s+|--\[(=*)\[.*?\]\1\]|--[^\n]*)*'
+    r'(?:("(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')'
+    r'|(\[(=*)\[\n?(.*?)\]\4\])'
+    r'|(0[xX][0-9A-Fa-f]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|([A-Za-z_]\w*)'
+    r'|([-{}\[\]=,;])'
+    r'|(.))',
+    re.DOTALL
+)
+STRING, LONG_STRING, NUMBER, NAME, PUNCTUATION, ERROR = 2, 3, 6, 7, 8, 9
+ESCAPE = re.compile(r'\\(?:(\d{1,3})|x([0-9A-Fa-f]{2})|u\{([0-9A-Fa-f]+)\}|z\s*|(.))', re.DOTALL)
+ESCAPES: dict = {
+    'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v', '\n': '\n',
+}
+CONSTANTS: dict = {'nil': None, 'true': True, 'false': False}
+
+
+class LuaSyntaxError(ValueError):
+    def __init__(self, message: str, position: int) -> None:
+        super().__init__(f"{message} at position {position}.")
+        self.position = position
+
+
+def unescape(value: str) -> str:
+    def replace(match: re.Match) -> str:
+        decimal, hexadecimal, codepoint, char = match.groups()
+        if decimal is not None:
+            return chr(int(decimal))
+        if hexadecimal is not None:
+            return chr(int(hexadecimal, 16))
+        if codepoint is not None:
+            return chr(int(codepoint, 16))
+        if char is None:
+            return ''
+        return ESCAPES.get(char, char)
+
+    return ESCAPE.sub(replace, value) if '\\' in value else value
+
+
+def to_number(value: str) -> int | float:
+    if value[:2] in ('0x', '0X'):
+        return int(value, 16)
+    if '.' in value or 'e' in value or 'E' in value:
+        return float(value)
+    return int(value)
+
+
+class Table:
+    __slots__ = ('items', 'fields', 'key', 'state')
+
+    def __init__(self) -> None:
+        self.items: list = []
+        self.fields: dict = {}
+        self.key: Any = None
+        self.state: str = 'field'
+
+    def build(self) -> dict | list:
+        if not self.fields:
+            return self.items if self.items else {}
+        for index, value in enumerate(self.items, start=1):
+            self.fields[index] = value
+        return self.fields
+
+
+def tokenize(text: str) -> Iterator[Tuple[int, Any, int]]:
+    for match in TOKEN.finditer(text):
+        kind = match.lastindex
+        if kind is None or kind == 1:
+            continue
+        if kind == STRING:
+            yield STRING, unescape(match.group(STRING)[1:-1]), match.start(kind)
+        elif kind == LONG_STRING:
+            yield STRING, match.group(5), match.start(kind)
+        elif kind == ERROR:
+            raise LuaSyntaxError(f"Unexpected character {match.group(kind)!r}", match.start(kind))
+        else:
+            yield kind, match.group(kind), match.start(kind)
+
+
+def iter_entries(text: str, depth: int = 1) -> Iterator[Tuple[Any, Any]]:
+    stack: List[Table] = []
+    tokens = tokenize(text)
+    sign: int = 1
+    started: bool = False
+
+    for kind, token, position in tokens:
+        if sign != 1 and kind != NUMBER and token != '-':
+            raise LuaSyntaxError("Expected a number after '-'", position)
+
+        if kind == NAME:
+            if token == 'return' and not started:
+                continue
+            if token in CONSTANTS:
+                value = CONSTANTS[token]
+            else:
+                following = next(tokens, None)
+                if not stack or stack[-1].state != 'field' or following is None or following[1] != '=':
+                    raise LuaSyntaxError(f"Unexpected name {token!r}", position)
+                stack[-1].key = token
+                stack[-1].state = 'value'
+                continue
+        elif kind == STRING:
+            value = token
+        elif kind == NUMBER:
+            value = sign * to_number(token)
+            sign = 1
+        elif token == '-':
+            sign = -sign
+            continue
+        elif token == '{':
+            if stack and stack[-1].state not in ('field', 'value'):
+                raise LuaSyntaxError("Unexpected '{'", position)
+            stack.append(Table())
+            started = True
+            continue
+        elif token == '}':
+            if not stack or stack[-1].state not in ('field', 'separator'):
+                raise LuaSyntaxError("Unexpected '}'", position)
+            value = stack.pop().build()
+            if not stack:
+                if depth == 0:
+                    yield None, value
+                return
+        elif token == '[':
+            if not stack or stack[-1].state != 'field':
+                raise LuaSyntaxError("Unexpected '['", position)
+            stack[-1].state = 'key'
+            continue
+        elif token == ']':
+            if not stack or stack[-1].state != 'key_closed':
+                raise LuaSyntaxError("Unexpected ']'", position)
+            stack[-1].state = 'key_assign'
+            continue
+        elif token == '=':
+            if not stack or stack[-1].state != 'key_assign':
+                raise LuaSyntaxError("Unexpected '='", position)
+            stack[-1].state = 'value'
+            continue
+        else:
+            if not stack or stack[-1].state != 'separator':
+                raise LuaSyntaxError(f"Unexpected {token!r}", position)
+            stack[-1].state = 'field'
+            continue
+
+        if not stack:
+            raise LuaSyntaxError('Expected a table', position)
+
+        table = stack[-1]
+        if table.state == 'key':
+            table.key = value
+            table.state = 'key_closed'
+        elif table.state == 'value':
+            if len(stack) == depth:
+                yield table.key, value
+            else:
+                table.fields[table.key] = value
+            table.key = None
+            table.state = 'separator'
+        elif table.state == 'field':
+            if len(stack) == depth:
+                yield None, value
+            else:
+                table.items.append(value)
+            table.state = 'separator'
+        else:
+            raise LuaSyntaxError('Unexpected value', position)
+
+    raise LuaSyntaxError('Unexpected end of input', len(text))
+
+
+def loads(text: str) -> Any:
+    for _, value in iter_entries(text, depth=0):
+        return value
+    raise LuaSyntaxError('Expected a table', 0)
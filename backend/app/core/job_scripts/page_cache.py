@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.core.http_client import http_client
+from app.core.job_scripts.parser import parse_page
+
+
+class PageCache:
+    def __init__(self) -> None:
+        self.__pages: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+        self.__values: Dict[str, asyncio.Future] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def __fetch(self, url: str, target: Optional[str]) -> BeautifulSoup:
+        try:
+            return parse_page(await http_client.get_content(url), target)
+        except Exception:
+            self.__pages.pop((url, target), None)
+            raise
+
+    async def get(self, url: str, target: Optional[str] = None) -> BeautifulSoup:
+        page = self.__pages.get((url, target))
+        if page is None:
+            self.misses += 1
+            page = asyncio.ensure_future(self.__fetch(url, target))
+            self.__pages[(url, target)] = page
+        else:
+            self.hits += 1
+
+        return await asyncio.shield(page)
+
+    async def __compute(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await factory()
+        except Exception:
+            self.__values.pop(key, None)
+            raise
+
+    async def memo(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.__values.get(key)
+        if value is None:
+            value = asyncio.ensure_future(self.__compute(key, factory))
+            self.__values[key] = value
+
+        return await asyncio.shield(value)
+
+    def stats(self) -> dict:
+        return {
+            'pages': len(self.__pages),
+            'values': len(self.__values),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def reset(self) -> None:
+        self.__pages.clear()
+        self.__values.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+page_cache = PageCache()
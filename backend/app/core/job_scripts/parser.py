@@ -0,0 +1,33 @@
+from importlib.util import find_spec
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.core.config import settings
+
+
+def has_class(*names: str) -> Callable[[Optional[str]], bool]:
+    return lambda value: value is not None and not set(names).isdisjoint(value.split())
+
+
+TARGETS: dict = {
+    'data_table': SoupStrainer('table', class_=has_class('article-table')),
+    'ability': SoupStrainer('div', class_=has_class('ability-info-container')),
+    'article': SoupStrainer('div', class_=has_class('mw-parser-output', 'noarticletext')),
+    'module': SoupStrainer('pre', class_=has_class('mw-code')),
+    'patch_notes': SoupStrainer('div', id='patch-notes-container'),
+}
+
+
+def get_parser_backend() -> str:
+    if settings.HTML_PARSER == 'auto':
+        return 'lxml' if find_spec('lxml') is not None else 'html.parser'
+    return settings.HTML_PARSER
+
+
+def parse_page(content: bytes, target: Optional[str] = None) -> BeautifulSoup:
+    return BeautifulSoup(
+        content,
+        get_parser_backend(),
+        parse_only=TARGETS[target] if target is not None and settings.HTML_PARSE_TARGETED else None
+    )
@@ -1,27 +1,40 @@
 import asyncio
-import json
+import logging
 import re
-from typing import List, Callable, Awaitable
+from typing import Awaitable, Callable, Collection, Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
 from bs4.element import Tag
-
-from app.core.job_scripts import KEYS, TACTICAL
+from fastapi import HTTPException
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.core.job_scripts import KEYS, TACTICAL, lua
+from app.core.job_scripts.page_cache import page_cache
+from app.core.job_scripts.parser import parse_page
+from app.core.job_scripts.stages import Stage, StageGraph
+from app.core.job_scripts.worker import jobs, run_in_worker
 from app.crud.champion import Champion
+from app.crud.etag import ETag
 from app.crud.item import Item
+from app.crud.manifest import Manifest
 from app.crud.patch import Patch
 from app.crud.perks import Perks
 from app.crud.shard import Shard
+from app.crud.snapshot import Snapshot
 from app.crud.summoner_spell import SummonerSpell
+from app.db import database
 from app.schema.utils import convert_string, remove_spaces
 
+logger = logging.getLogger(__name__)
+
+releases: Dict[str, StageGraph] = {}
+release_locks: Dict[str, asyncio.Lock] = {}
+
 
 async def get_champ_info(champ_name: str) -> dict:
     data: dict = {}
-    page = BeautifulSoup(
-        requests.get(f"https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}").content
-    )
+    page = await page_cache.get(f"https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}", 'data_table')
     table = page.find('table', class_='article-table')
     for tr in table.find_all('tr')[1:]:
         if len(tr.find_all('th')) == 1:
@@ -39,8 +52,8 @@ async def get_champ_info(champ_name: str) -> dict:
 
 async def get_champ_bio(title: str) -> List[str]:
     data: List[str] = []
-    page = BeautifulSoup(
-        requests.get(f'https://leagueoflegends.fandom.com/wiki/{title}').content
+    page = parse_page(
+        await http_client.get_content(f'https://leagueoflegends.fandom.com/wiki/{title}'), 'article'
     )
     bio = page.find('span', id=['Biography', 'Lore'])
     if bio:
@@ -55,12 +68,13 @@ async def get_champ_bio(title: str) -> List[str]:
 
 async def get_champ_strategy(champ_name: str) -> dict:
     data: dict = {}
-    page = BeautifulSoup(
-        requests.get(f'https://leagueoflegends.fandom.com/wiki/{champ_name}/Strategy').content
+    page = parse_page(
+        await http_client.get_content(f'https://leagueoflegends.fandom.com/wiki/{champ_name}/Strategy'), 'article'
     )
     if page.find('div', class_='noarticletext mw-content-ltr'):
-        page = BeautifulSoup(
-            requests.get(f'https://leagueoflegends.fandom.com/wiki/{champ_name}/LoL/Strategy').content
+        page = parse_page(
+            await http_client.get_content(f'https://leagueoflegends.fandom.com/wiki/{champ_name}/LoL/Strategy'),
+            'article'
         )
 
     recommended_items = page.find('span', id='Recommended_Items')
@@ -237,31 +251,15 @@ async def get_champ_strategy(champ_name: str) -> dict:
 
 
 async def get_champ_skins() -> dict:
-    page = BeautifulSoup(
-        requests.get('https://leagueoflegends.fandom.com/wiki/Module:SkinData/data').content
-    )
+    page = await page_cache.get('https://leagueoflegends.fandom.com/wiki/Module:SkinData/data', 'module')
     code_text = page.find('pre', class_='mw-code mw-script', dir='ltr').get_text()
-    code_text = re.sub(r'-- <pre>', '', code_text)
-    code_text = re.sub(r'return\s*', '', code_text)
-    code_text = re.sub(r'\["', '"', code_text)
-    code_text = re.sub(r'"]', '"', code_text)
-    code_text = re.sub(r'=', ':', code_text)
-    code_text = re.sub(r'\{"', '["', code_text)
-    code_text = re.sub(r'"}', '"]', code_text)
-    code_text = re.sub(r'nil', 'null', code_text)
-    code_text = re.sub(r',\s*([]}])', r'\1', code_text)
-    code_text = re.sub(r',\s*--.*$', ',', code_text, flags=re.MULTILINE)
-    code_text = re.sub(r'--\s</pre>.*$', '', code_text, flags=re.DOTALL)
-    code_text = code_text.strip()
-
-    return json.loads(code_text)
+
+    return dict(lua.iter_entries(code_text))
 
 
 async def get_champ_stats(champ_name: str) -> dict:
     data: dict = {}
-    page = BeautifulSoup(
-        requests.get(f'https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}').content
-    )
+    page = await page_cache.get(f'https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}', 'data_table')
     table_title = page.find('table', class_='article-table').find_all(
         "th", colspan=3, string=lambda text: text.strip() in ['Stats', 'Special Stats']
     )
@@ -280,13 +278,16 @@ async def get_champ_stats(champ_name: str) -> dict:
     return data
 
 
-def get_champ_spell(champ_name: str, spell_name: str) -> dict:
+async def get_champ_spell(champ_name: str, spell_name: str) -> dict:
     data: dict = {}
     _spell_name: str = spell_name.replace(' ', '_')
 
     try:
-        page = BeautifulSoup(
-            requests.get(f"https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}/{_spell_name}").content
+        page = parse_page(
+            await http_client.get_content(
+                f"https://leagueoflegends.fandom.com/wiki/Template:Data_{champ_name}/{_spell_name}"
+            ),
+            'ability'
         )
         ability = page.find('div', class_='ability-info-container').find_all('div', recursive=False)
 
@@ -349,156 +350,182 @@ def get_champ_spell(champ_name: str, spell_name: str) -> dict:
     return data
 
 
-async def get_champ_data(version: str) -> List[dict]:
-    data: dict = {}
-
-    dragon = requests.get(f"https://ddragon.leagueoflegends.com/cdn/{version}.1/data/en_US/championFull.json").json()
-    skins = await get_champ_skins()
-
-    for champ in dragon['data'].values():
-        champ_id = champ.get('key')
-        champ_name = champ.get('name')
-        champ_skins = {
-            name: {
-                "cost": skin['cost'],
-                "release_date": skin["release"],
-                "voice_actor": skin.get('voiceactor'),
-                "splash_artist": skin.get("splashartist"),
-                "lore": skin.get('lore')
-            } for name, skin in skins.get(champ_name, {}).get('skins', {}).items()
-        }
-        champ_info = await get_champ_info(champ_name)
-        champ_strategy = await get_champ_strategy(champ_name)
-        champ_bio = await get_champ_bio(champ_info['title'])
-        _champ_info = {
-            **{k: champ_info[v] for k, v in KEYS.items()},
-            "tactical": {k: champ_info[v] for k, v in TACTICAL.items()},
-            **champ_strategy,
-            "biography": champ_bio
-        }
-
-        community = requests.get(
+async def get_champ(version: str, champ: dict, skins: dict) -> dict:
+    champ_id = champ.get('key')
+    champ_name = champ.get('name')
+    champ_skins = {
+        name: {
+            "cost": skin['cost'],
+            "release_date": skin["release"],
+            "voice_actor": skin.get('voiceactor'),
+            "splash_artist": skin.get("splashartist"),
+            "lore": skin.get('lore')
+        } for name, skin in skins.get(champ_name, {}).get('skins', {}).items()
+    }
+    champ_info, champ_strategy, community, champ_stats, champ_passive, *champ_spells = await asyncio.gather(
+        get_champ_info(champ_name),
+        get_champ_strategy(champ_name),
+        http_client.get_json(
             f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champions/{champ_id}.json"
-        ).json()
-        champ_stats = await get_champ_stats(champ_name)
-
-        data[champ_id] = {
-            **_champ_info,
-            'champ_id': champ_id,
-            'name': champ_name,
-            'patch': version,
-            'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-icons/{champ_id}.png",
-            'stats': {
-                'health': {
-                    'flat': champ.get('stats', {}).get('hp', 0),
-                    'per_level': champ.get('stats', {}).get('hpperlevel', 0),
-                },
-                'health_regen': {
-                    'flat': champ.get('stats', {}).get('hpregen', 0),
-                    'per_level': champ.get('stats', {}).get('hpregenperlevel', 0),
-                },
-                'mana': {
-                    'flat': champ.get('stats', {}).get('mp', 0),
-                    'per_level': champ.get('stats', {}).get('mpperlevel', 0),
-                },
-                'mana_regen': {
-                    'flat': champ.get('stats', {}).get('mpregen', 0),
-                    'per_level': champ.get('stats', {}).get('mpregenperlevel', 0),
-                },
-                'move_speed': {
-                    'flat': champ.get('stats', {}).get('movespeed', 0),
-                    'per_level': champ.get('stats', {}).get('movespeedperlevel', 0),
-                },
-                'armor': {
-                    'flat': champ.get('stats', {}).get('armor', 0),
-                    'per_level': champ.get('stats', {}).get('armorperlevel', 0),
-                },
-                'magic_resistance': {
-                    'flat': champ.get('stats', {}).get('spellblock', 0),
-                    'per_level': champ.get('stats', {}).get('spellblockperlevel', 0),
-                },
-                'attack_range': {
-                    'flat': champ.get('stats', {}).get('attackrange', 0),
-                    'per_level': champ.get('stats', {}).get('attackrangeperlevel', 0),
-                },
-                'crit': {
-                    'flat': champ.get('stats', {}).get('crit', 0),
-                    'per_level': champ.get('stats', {}).get('critperlevel', 0),
-                },
-                'attack_damage': {
-                    'flat': champ.get('stats', {}).get('attackdamage', 0),
-                    'per_level': champ.get('stats', {}).get('attackdamageperlevel', 0),
-                },
-                'attack_speed': {
-                    'flat': champ.get('stats', {}).get('attackspeed', 0),
-                    'per_level': champ.get('stats', {}).get('attackspeedperlevel', 0),
-                },
-                "missile_speed": champ_stats['missile_speed'],
-                "attack_cast_time": champ_stats['attack_cast_time'],
-                "attack_total_time": champ_stats['attack_total_time'],
-                "attack_delay_offset": champ_stats['attack_delay_offset'],
-                "acquisition_radius": champ_stats['acquisition_radius'],
-                "selection_radius": champ_stats['selection_radius'],
-                "gameplay_radius": champ_stats['gameplay_radius'],
-                "pathing_radius": champ_stats['pathing_radius'],
-                "aram_dmg_dealt": champ_stats['aram_dmg_dealt'],
-                "aram_dmg_taken": champ_stats['aram_dmg_taken'],
-                "aram_healing": champ_stats['aram_healing'],
-                "aram_shielding": champ_stats['aram_shielding'],
-                "urf_dmg_dealt": champ_stats['urf_dmg_dealt'],
-                "urf_dmg_taken": champ_stats['urf_dmg_taken'],
-                "urf_healing": champ_stats['urf_healing'],
-                "urf_shielding": champ_stats['urf_shielding'],
+        ),
+        get_champ_stats(champ_name),
+        get_champ_spell(champ_name, champ.get("passive", {}).get('name')),
+        *(get_champ_spell(champ_name, spell['name']) for spell in champ.get("spells", []))
+    )
+    champ_bio = await get_champ_bio(champ_info['title'])
+    _champ_info = {
+        **{k: champ_info[v] for k, v in KEYS.items()},
+        "tactical": {k: champ_info[v] for k, v in TACTICAL.items()},
+        **champ_strategy,
+        "biography": champ_bio
+    }
+
+    return {
+        **_champ_info,
+        'champ_id': champ_id,
+        'name': champ_name,
+        'patch': version,
+        'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-icons/{champ_id}.png",
+        'stats': {
+            'health': {
+                'flat': champ.get('stats', {}).get('hp', 0),
+                'per_level': champ.get('stats', {}).get('hpperlevel', 0),
             },
-            "spells": [
-                {
-                    "key": spell["id"][-1],
-                    "name": spell["name"],
-                    "description": community['spells'][i]['description'],
-                    'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/assets/characters/{champ_name.lower()}/hud/icons2d/{community['spells'][i]['abilityIconPath']}",
-                    "max_rank": spell.get("maxrank"),
-                    **get_champ_spell(champ_name, spell['name']),
-                    "cooldown": spell.get("cooldown"),
-                    "cost": spell.get("cost"),
-                    "range": spell.get("range"),
-                } for i, spell in enumerate(champ.get("spells", []))
-            ],
-            'passive': {
-                'name': champ.get("passive", {}).get('name'),
-                'description': community.get("passive").get("description"),
-                'icon': community.get("passive").get("abilityIconPath"),
-                **get_champ_spell(champ_name, champ.get("passive", {}).get('name'))
+            'health_regen': {
+                'flat': champ.get('stats', {}).get('hpregen', 0),
+                'per_level': champ.get('stats', {}).get('hpregenperlevel', 0),
             },
-            "skins": [
-                {
-                    'id': skin['id'],
-                    'is_base': skin['isBase'],
-                    'name': skin['name'],
-                    **(champ_skins[next((key for key in champ_skins if key in skin['name']), None)] if next(
-                        (key for key in champ_skins if key in skin['name']), None) else {}),
-                    'splash': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-splashes/{champ_id}/{skin['splashPath'].split('/')[-1]}",
-                    'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-tiles/{champ_id}/{skin['tilePath'].split('/')[-1]}",
-                    "chroma_icon": f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-chroma-images/{champ_id}/{skin['chromaPath'].split('/')[-1]}" if skin.get(
-                        'chromaPath') is not None else None,
-                    "chromas": [
-                        {
-                            'id': chroma.get('id'),
-                            'name': chroma.get('name'),
-                            'icon': chroma.get('chromaPath'),
-                        } for chroma in skin.get("chromas", [])
-                    ]
-                } for skin in community['skins']
-            ]
-        }
+            'mana': {
+                'flat': champ.get('stats', {}).get('mp', 0),
+                'per_level': champ.get('stats', {}).get('mpperlevel', 0),
+            },
+            'mana_regen': {
+                'flat': champ.get('stats', {}).get('mpregen', 0),
+                'per_level': champ.get('stats', {}).get('mpregenperlevel', 0),
+            },
+            'move_speed': {
+                'flat': champ.get('stats', {}).get('movespeed', 0),
+                'per_level': champ.get('stats', {}).get('movespeedperlevel', 0),
+            },
+            'armor': {
+                'flat': champ.get('stats', {}).get('armor', 0),
+                'per_level': champ.get('stats', {}).get('armorperlevel', 0),
+            },
+            'magic_resistance': {
+                'flat': champ.get('stats', {}).get('spellblock', 0),
+                'per_level': champ.get('stats', {}).get('spellblockperlevel', 0),
+            },
+            'attack_range': {
+                'flat': champ.get('stats', {}).get('attackrange', 0),
+                'per_level': champ.get('stats', {}).get('attackrangeperlevel', 0),
+            },
+            'crit': {
+                'flat': champ.get('stats', {}).get('crit', 0),
+                'per_level': champ.get('stats', {}).get('critperlevel', 0),
+            },
+            'attack_damage': {
+                'flat': champ.get('stats', {}).get('attackdamage', 0),
+                'per_level': champ.get('stats', {}).get('attackdamageperlevel', 0),
+            },
+            'attack_speed': {
+                'flat': champ.get('stats', {}).get('attackspeed', 0),
+                'per_level': champ.get('stats', {}).get('attackspeedperlevel', 0),
+            },
+            "missile_speed": champ_stats['missile_speed'],
+            "attack_cast_time": champ_stats['attack_cast_time'],
+            "attack_total_time": champ_stats['attack_total_time'],
+            "attack_delay_offset": champ_stats['attack_delay_offset'],
+            "acquisition_radius": champ_stats['acquisition_radius'],
+            "selection_radius": champ_stats['selection_radius'],
+            "gameplay_radius": champ_stats['gameplay_radius'],
+            "pathing_radius": champ_stats['pathing_radius'],
+            "aram_dmg_dealt": champ_stats['aram_dmg_dealt'],
+            "aram_dmg_taken": champ_stats['aram_dmg_taken'],
+            "aram_healing": champ_stats['aram_healing'],
+            "aram_shielding": champ_stats['aram_shielding'],
+            "urf_dmg_dealt": champ_stats['urf_dmg_dealt'],
+            "urf_dmg_taken": champ_stats['urf_dmg_taken'],
+            "urf_healing": champ_stats['urf_healing'],
+            "urf_shielding": champ_stats['urf_shielding'],
+        },
+        "spells": [
+            {
+                "key": spell["id"][-1],
+                "name": spell["name"],
+                "description": community['spells'][i]['description'],
+                'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/assets/characters/{champ_name.lower()}/hud/icons2d/{community['spells'][i]['abilityIconPath']}",
+                "max_rank": spell.get("maxrank"),
+                **champ_spells[i],
+                "cooldown": spell.get("cooldown"),
+                "cost": spell.get("cost"),
+                "range": spell.get("range"),
+            } for i, spell in enumerate(champ.get("spells", []))
+        ],
+        'passive': {
+            'name': champ.get("passive", {}).get('name'),
+            'description': community.get("passive").get("description"),
+            'icon': community.get("passive").get("abilityIconPath"),
+            **champ_passive
+        },
+        "skins": [
+            {
+                'id': skin['id'],
+                'is_base': skin['isBase'],
+                'name': skin['name'],
+                **(champ_skins[next((key for key in champ_skins if key in skin['name']), None)] if next(
+                    (key for key in champ_skins if key in skin['name']), None) else {}),
+                'splash': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-splashes/{champ_id}/{skin['splashPath'].split('/')[-1]}",
+                'icon': f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-tiles/{champ_id}/{skin['tilePath'].split('/')[-1]}",
+                "chroma_icon": f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/champion-chroma-images/{champ_id}/{skin['chromaPath'].split('/')[-1]}" if skin.get(
+                    'chromaPath') is not None else None,
+                "chromas": [
+                    {
+                        'id': chroma.get('id'),
+                        'name': chroma.get('name'),
+                        'icon': chroma.get('chromaPath'),
+                    } for chroma in skin.get("chromas", [])
+                ]
+            } for skin in community['skins']
+        ]
+    }
+
+
+async def get_champ_data(
+        version: str,
+        skip: Collection[str] = (),
+        on_scraped: Optional[Callable[[dict], Awaitable[None]]] = None,
+        failed: Optional[List[str]] = None
+) -> List[dict]:
+    dragon, skins = await asyncio.gather(
+        http_client.get_json(f"https://ddragon.leagueoflegends.com/cdn/{version}.1/data/en_US/championFull.json"),
+        page_cache.memo('champ_skins', get_champ_skins)
+    )
+    semaphore = asyncio.Semaphore(settings.SCRAPER_CONCURRENCY)
+
+    async def scrape(champ: dict) -> Optional[dict]:
+        async with semaphore:
+            try:
+                data = await get_champ(version, champ, skins)
+            except Exception:
+                logger.exception(f"Failed to scrape champion {champ.get('name')} for patch {version}.")
+                if failed is not None:
+                    failed.append(champ['key'])
+                return None
 
-    return list(data.values())
+        if on_scraped is not None:
+            await on_scraped(data)
+        return data
+
+    data = await asyncio.gather(*(scrape(champ) for champ in dragon['data'].values() if champ['key'] not in skip))
+
+    return [champ for champ in data if champ is not None]
 
 
 async def get_patch_data(version: str) -> dict:
-    page = requests.get(
+    page = await http_client.get_content(
         f"https://www.leagueoflegends.com/en-gb/news/game-updates/patch-{version.replace('.', '-')}-notes/"
     )
-    soup = BeautifulSoup(page.content)
+    soup = parse_page(page, 'patch_notes')
     patch_container = soup.find('div', id='patch-notes-container')
     data = {'version': version}
 
@@ -607,9 +634,9 @@ async def get_patch_data(version: str) -> dict:
 
 
 async def get_shard_data(version: str) -> List[dict]:
-    shards = requests.get(
+    shards = await http_client.get_json(
         f'https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/perks.json'
-    ).json()
+    )
 
     for shard in shards:
         if 'statmods' in shard.get('iconPath', '').lower():
@@ -621,9 +648,9 @@ async def get_shard_data(version: str) -> List[dict]:
 
 
 async def get_summoner_spell_data(version: str) -> List[dict]:
-    summoner_spell = requests.get(
+    summoner_spell = await http_client.get_json(
         f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/summoner-spells.json"
-    ).json()
+    )
 
     for data in summoner_spell:
         if 'iconPath' in data:
@@ -645,8 +672,8 @@ async def get_perks_data(version: str) -> List[dict]:
         "Resolve": ["Strength", "Resistance", "Vitality"],
         "Inspiration": ["Contraption", "Tomorrow", "Beyond"],
     }
-    perks: List[dict] = requests.get(
-        f'https://ddragon.leagueoflegends.com/cdn/{version}.1/data/en_US/runesReforged.json').json()
+    perks: List[dict] = await http_client.get_json(
+        f'https://ddragon.leagueoflegends.com/cdn/{version}.1/data/en_US/runesReforged.json')
     perks_path: str = f"https://raw.communitydragon.org/{version}/game/assets/perks/styles"
 
     for perk in perks:
@@ -682,16 +709,16 @@ async def get_perks_data(version: str) -> List[dict]:
 
 async def get_items_data(version: str) -> List[dict]:
     data: list = []
-    community = requests.get(
+    community = await http_client.get(
         f"https://raw.communitydragon.org/{version}/plugins/rcp-be-lol-game-data/global/default/v1/items.json"
     )
     icons = {
         str(item['id']): item['iconPath'] for item in community.json()
     } if community.status_code == 200 else {}
 
-    for item_id, items in requests.get(
+    for item_id, items in (await http_client.get_json(
             f'https://ddragon.leagueoflegends.com/cdn/{version}.1/data/en_US/item.json'
-    ).json()["data"].items():
+    ))["data"].items():
         try:
             int(item_id)
         except Exception:
@@ -770,27 +797,211 @@ async def get_items_data(version: str) -> List[dict]:
 async def add_data(
         version: str,
         get_data_func: Callable[[str], Awaitable[List[dict] | dict]],
-        add_func: Callable[[dict], Awaitable[None]]
-) -> None:
+        add_many_func: Callable[..., Awaitable[List[dict]]],
+        collection: str,
+        previous_version: Optional[str] = None
+) -> List[dict]:
     data = await get_data_func(version)
 
-    if isinstance(data, list):
-        tasks = [add_func(sub_data) for sub_data in data]
-        await asyncio.gather(*tasks)
-    else:
-        await add_func(data)
+    records = data if isinstance(data, list) else [data]
+    result = await (add_many_func(records, previous_version) if previous_version else add_many_func(records))
+    added = sum(1 for response in result if response['_id'] is not None)
+    logger.info(f"Patch {version} {get_data_func.__name__}: {added}/{len(result)} records added.")
+
+    await ETag.set(collection, version, ETag.compute(data))
+
+    return result
+
+
+async def add_patch(version: str) -> List[dict]:
+    result = await add_data(version, get_patch_data, Patch.add_many, settings.PATCH_COLLECTION)
+    Patch.expire_last_version()
+    await database.repository.sync([version])
+    return result
+
+
+async def add_champions(version: str, previous: Optional[str], manifest: Manifest) -> List[dict]:
+    result: List[dict] = []
+    pending: List[dict] = []
+    lock = asyncio.Lock()
+
+    async def flush() -> None:
+        records = pending.copy()
+        pending.clear()
+        result.extend(await Champion.add_many(records, previous))
+        await manifest.entities_done('champion', [str(record['champ_id']) for record in records])
+
+    async def on_scraped(champion: dict) -> None:
+        async with lock:
+            pending.append(champion)
+            if len(pending) >= settings.CHECKPOINT_SIZE:
+                await flush()
+
+    done = set(manifest.entities.get('champion', []))
+    failed: List[str] = []
+    await get_champ_data(version, done, on_scraped, failed)
+    async with lock:
+        if pending:
+            await flush()
+
+    await manifest.entities_failed('champion', failed)
+    if len(failed) > settings.SCRAPER_FAILURE_TOLERANCE:
+        raise RuntimeError(f"Patch {version}: {len(failed)} champions failed to scrape ({', '.join(failed)}).")
+    if failed:
+        logger.warning(f"Patch {version}: publishing without {len(failed)} champions ({', '.join(failed)}).")
+
+    added = sum(1 for response in result if response['_id'] is not None)
+    logger.info(f"Patch {version} get_champ_data: {added}/{len(result)} records added, {len(done)} resumed.")
+
+    await ETag.set(settings.CHAMPION_COLLECTION, version, ETag.compute(await Champion(version).get()))
+
+    return result
+
+
+async def save_snapshot(version: str, collection: str, crud: type) -> List[dict]:
+    documents = await crud(version).get()
+    await Snapshot.save(collection, version, documents)
+    return documents
+
+
+def checkpoint(manifest: Manifest, name: str, func: Callable[[], Awaitable[List[dict]]]) -> Callable:
+    async def run() -> List[dict]:
+        result = await func()
+        await manifest.stage_done(name)
+        return result
+
+    return run
+
+
+def release_stages(version: str, previous: Optional[str], manifest: Manifest) -> StageGraph:
+    stages = [
+        Stage('shard', lambda: add_data(version, get_shard_data, Shard.add_many, settings.SHARD_COLLECTION, previous)),
+        Stage('perks', lambda: add_data(version, get_perks_data, Perks.add_many, settings.PERKS_COLLECTION, previous)),
+        Stage('summoner_spell', lambda: add_data(
+            version, get_summoner_spell_data, SummonerSpell.add_many, settings.SUMMONER_SPELL_COLLECTION, previous
+        )),
+        Stage('champion', lambda: add_champions(version, previous, manifest)),
+        Stage('item', lambda: add_data(version, get_items_data, Item.add_many, settings.ITEM_COLLECTION, previous)),
+    ]
+
+    if settings.SNAPSHOT_BUCKET:
+        for name, collection, crud in (
+                ('champion', settings.CHAMPION_COLLECTION, Champion),
+                ('item', settings.ITEM_COLLECTION, Item),
+                ('perks', settings.PERKS_COLLECTION, Perks)
+        ):
+            stages.append(Stage(
+                f"{name}_snapshot", lambda collection=collection, crud=crud: save_snapshot(version, collection, crud),
+                (name,)
+            ))
+
+    stages.append(Stage('patch', lambda: add_patch(version), tuple(stage.name for stage in stages)))
+
+    for stage in stages:
+        stage.func = checkpoint(manifest, stage.name, stage.func)
+        if manifest.stages.get(stage.name):
+            stage.status = 'done'
+
+    return StageGraph(stages, settings.STAGE_CONCURRENCY, settings.STAGE_RETRIES)
+
+
+async def run_release(
+        version: str,
+        names: Optional[List[str]] = None,
+        reset_cache: bool = True
+) -> Dict[str, dict]:
+    async with release_locks.setdefault(version, asyncio.Lock()):
+        if reset_cache:
+            page_cache.reset()
+        try:
+            return await releases[version].run(names)
+        finally:
+            logger.info(f"Patch {version} page cache: {page_cache.stats()}")
+            if reset_cache:
+                page_cache.reset()
+
+
+def retry_names(graph: StageGraph, name: str) -> List[str]:
+    return [name, *(
+        dependant for dependant in graph.dependants(name)
+        if graph.stages[dependant].status != 'done' or dependant.endswith('_snapshot')
+    )]
+
+
+async def retry_stage(version: str, name: str) -> Dict[str, dict]:
+    if version not in releases and version in jobs:
+        if name not in jobs[version]['progress']:
+            raise HTTPException(400, f"Stage {name} does not exist.")
+        if jobs[version]['status'] == 'running':
+            raise HTTPException(400, f"Patch {version} is already being ingested.")
+        return await ingest_in_worker(jobs[version]['args'][0], jobs[version]['args'][1], name)
+
+    if version not in releases:
+        raise HTTPException(400, f"No release run found for patch {version}.")
+    if name not in releases[version].stages:
+        raise HTTPException(400, f"Stage {name} does not exist.")
+    if version in release_locks and release_locks[version].locked():
+        raise HTTPException(400, f"Patch {version} is already being ingested.")
+
+    return await run_release(version, retry_names(releases[version], name))
+
+
+async def ingest_version(
+        version: str,
+        previous: Optional[str],
+        reset_cache: bool = True,
+        retry: Optional[str] = None
+) -> Dict[str, dict]:
+    manifest = await Manifest(version).load()
+    if manifest.stages:
+        logger.info(f"Resuming patch {version} after stages {', '.join(manifest.stages)}.")
+
+    releases[version] = release_stages(version, previous, manifest)
+    names = retry_names(releases[version], retry) if retry is not None else None
+    report = await run_release(version, names, reset_cache)
+    if report['patch']['status'] == 'done':
+        await manifest.mark_complete()
+
+    return report
+
+
+def release_report(version: str, *_) -> Dict[str, dict]:
+    return releases[version].report() if version in releases else {}
+
+
+def release_progress(version: str) -> Optional[Dict[str, dict]]:
+    if version in releases:
+        return releases[version].report()
+    if version in jobs:
+        return jobs[version]['progress']
+    return None
+
+
+async def ingest_in_worker(version: str, previous: Optional[str], retry: Optional[str] = None) -> Dict[str, dict]:
+    job = await run_in_worker(version, ingest_version, (version, previous, True, retry), release_report)
+
+    for collection in (
+            settings.PATCH_COLLECTION, settings.CHAMPION_COLLECTION, settings.ITEM_COLLECTION,
+            settings.PERKS_COLLECTION, settings.SUMMONER_SPELL_COLLECTION, settings.SHARD_COLLECTION,
+            settings.ETAG_COLLECTION, settings.SNAPSHOT_PREFIX
+    ):
+        read_cache.invalidate(collection, version)
+    Patch.expire_last_version()
+    await database.repository.reload()
+
+    return job['result'] or job['progress']
 
 
 async def patch_release() -> None:
-    version = requests.get('https://ddragon.leagueoflegends.com/api/versions.json').json()[0][:-2]
+    version = (await http_client.get_json('https://ddragon.leagueoflegends.com/api/versions.json'))[0][:-2]
 
     patch = Patch(version)
     try:
         await patch.get()
     except Exception:
-        await add_data(version, get_patch_data, Patch.add)
-        await add_data(version, get_shard_data, Shard.add)
-        await add_data(version, get_perks_data, Perks.add)
-        await add_data(version, get_summoner_spell_data, SummonerSpell.add)
-        await add_data(version, get_champ_data, Champion.add)
-        await add_data(version, get_items_data, Item.add)
+        last_version = await Patch.refresh_last_version()
+        previous = last_version['version'] if last_version and last_version['version'] != version else None
+        if settings.INGESTION_WORKER:
+            await ingest_in_worker(version, previous)
+        else:
+            await ingest_version(version, previous)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]], depends_on: Tuple[str, ...] = ()) -> None:
+        self.name: str = name
+        self.func: Callable[[], Awaitable[Any]] = func
+        self.depends_on: Tuple[str, ...] = depends_on
+        self.status: str = 'pending'
+        self.attempts: int = 0
+        self.duration: Optional[float] = None
+        self.records: Optional[int] = None
+        self.error: Optional[str] = None
+
+    def report(self) -> dict:
+        return {
+            'status': self.status,
+            'depends_on': list(self.depends_on),
+            'attempts': self.attempts,
+            'duration': self.duration,
+            'records': self.records,
+            'error': self.error,
+        }
+
+
+class StageGraph:
+    def __init__(self, stages: List[Stage], concurrency: int, retries: int = 0) -> None:
+        self.stages: Dict[str, Stage] = {stage.name: stage for stage in stages}
+        self.__concurrency: int = concurrency
+        self.__retries: int = retries
+
+        for stage in stages:
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dependency}.")
+
+    async def __run_stage(self, stage: Stage, dependencies: List[asyncio.Task], semaphore: asyncio.Semaphore) -> None:
+        await asyncio.gather(*dependencies)
+        if any(self.stages[dependency].status != 'done' for dependency in stage.depends_on):
+            stage.status = 'skipped'
+            stage.error = f"Dependencies {', '.join(stage.depends_on)} did not complete."
+            return
+
+        for _ in range(self.__retries + 1):
+            async with semaphore:
+                stage.status = 'running'
+                stage.attempts += 1
+                start = time.perf_counter()
+                try:
+                    result = await stage.func()
+                except Exception as e:
+                    stage.status = 'failed'
+                    stage.error = repr(e)
+                    logger.exception(f"Stage {stage.name} failed on attempt {stage.attempts}.")
+                else:
+                    stage.status = 'done'
+                    stage.error = None
+                    stage.records = len(result) if isinstance(result, (list, dict)) else None
+                    return
+                finally:
+                    stage.duration = time.perf_counter() - start
+
+    async def run(self, names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        if names is None:
+            selected = {name for name, stage in self.stages.items() if stage.status != 'done'}
+        else:
+            selected = set(names)
+            for name in selected - self.stages.keys():
+                raise ValueError(f"Unknown stage {name}.")
+
+        semaphore = asyncio.Semaphore(self.__concurrency)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        def schedule(name: str) -> asyncio.Task:
+            if name not in tasks:
+                stage = self.stages[name]
+                dependencies = [schedule(dependency) for dependency in stage.depends_on if dependency in selected]
+                tasks[name] = asyncio.ensure_future(self.__run_stage(stage, dependencies, semaphore))
+            return tasks[name]
+
+        for name in selected:
+            schedule(name)
+        await asyncio.gather(*tasks.values())
+
+        for name in selected:
+            stage = self.stages[name]
+            logger.info(
+                f"Stage {name}: {stage.status} after {stage.attempts} attempt(s) "
+                f"in {stage.duration or 0:.1f}s, {stage.records} records."
+            )
+        return self.report()
+
+    def dependants(self, name: str) -> List[str]:
+        result: List[str] = []
+        for stage in self.stages.values():
+            if name in stage.depends_on and stage.name not in result:
+                result.append(stage.name)
+                result.extend(dependant for dependant in self.dependants(stage.name) if dependant not in result)
+        return result
+
+    def report(self) -> Dict[str, dict]:
+        return {name: stage.report() for name, stage in self.stages.items()}
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from queue import Empty
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from app.core.config import settings
+from app.core.http_client import http_client
+from app.db import connect
+
+logger = logging.getLogger(__name__)
+
+jobs: Dict[str, dict] = {}
+
+
+async def run_job(
+        func: Callable[..., Awaitable[Any]],
+        args: Tuple,
+        progress: Callable[..., Any],
+        queue: multiprocessing.Queue
+) -> None:
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(settings.INGESTION_PROGRESS_INTERVAL)
+            queue.put({'progress': progress(*args)})
+
+    reporter = asyncio.create_task(report())
+    try:
+        result = await func(*args)
+        queue.put({'status': 'done', 'progress': progress(*args), 'result': result})
+    except Exception as e:
+        logger.exception(f"Worker job {func.__name__} failed.")
+        queue.put({'status': 'failed', 'progress': progress(*args), 'error': str(e)})
+    finally:
+        reporter.cancel()
+        http_client.close()
+
+
+def main(func: Callable[..., Awaitable[Any]], args: Tuple, progress: Callable[..., Any], queue) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    connect()
+    asyncio.run(run_job(func, args, progress, queue))
+
+
+async def run_in_worker(
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        args: Tuple,
+        progress: Callable[..., Any]
+) -> dict:
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=main, args=(func, args, progress, queue), name=name, daemon=True)
+    process.start()
+
+    job = jobs[name] = {
+        'status': 'running',
+        'pid': process.pid,
+        'args': args,
+        'start': time.time(),
+        'progress': {},
+        'result': None,
+        'error': None,
+    }
+    logger.info(f"Worker job {name} started in process {process.pid}.")
+
+    while process.is_alive():
+        try:
+            job.update(await asyncio.to_thread(queue.get, True, settings.INGESTION_PROGRESS_INTERVAL))
+        except Empty:
+            continue
+    await asyncio.to_thread(process.join)
+    while True:
+        try:
+            job.update(queue.get_nowait())
+        except Empty:
+            break
+
+    if job['status'] == 'running':
+        job['status'] = 'failed'
+        job['error'] = f"Worker exited with code {process.exitcode}."
+    logger.info(f"Worker job {name} {job['status']} in {time.time() - job['start']:.0f}s.")
+    return job
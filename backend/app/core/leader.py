@@ -0,0 +1,92 @@
+import asyncio
+import fcntl
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Callable, Optional, TextIO
+
+from app.core.config import settings
+from app.db import database
+
+logger = logging.getLogger(__name__)
+
+
+class Leader:
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.id: str = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader: bool = False
+        self.__file: Optional[TextIO] = None
+        self.__lease: Optional[dict] = None
+        self.__task: Optional[asyncio.Task] = None
+
+    def __lock_file(self) -> bool:
+        if self.__file is None:
+            self.__file = open(settings.LEADER_LOCK_PATH, 'a')
+        try:
+            fcntl.flock(self.__file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    async def __renew_lease(self) -> bool:
+        current = await database.repository.get(settings.LEADER_COLLECTION, self.name)
+        now = time.time()
+        if current is not None and current.get('holder') != self.id and current.get('expires', 0) > now:
+            return False
+
+        lease = {'holder': self.id, 'expires': now + settings.LEADER_LEASE_TTL}
+        if not await database.repository.swap(settings.LEADER_COLLECTION, self.name, current, lease):
+            return False
+        self.__lease = lease
+        return True
+
+    async def acquire(self) -> bool:
+        if settings.LEADER_ELECTION == 'file':
+            return self.__lock_file()
+        if settings.LEADER_ELECTION == 'lease':
+            return await self.__renew_lease()
+        return True
+
+    async def __campaign(self, on_elected: Callable[[], None], on_lost: Callable[[], None]) -> None:
+        while True:
+            try:
+                elected = await self.acquire()
+            except Exception:
+                logger.exception(f"Leader election for {self.name} failed.")
+                elected = False
+
+            if elected and not self.is_leader:
+                logger.info(f"{self.id} elected leader for {self.name}.")
+                self.is_leader = True
+                on_elected()
+            elif not elected and self.is_leader:
+                logger.warning(f"{self.id} lost leadership for {self.name}.")
+                self.is_leader = False
+                on_lost()
+
+            await asyncio.sleep(settings.LEADER_RENEW_INTERVAL)
+
+    def start(self, on_elected: Callable[[], None], on_lost: Callable[[], None]) -> None:
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__campaign(on_elected, on_lost))
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+        if self.__file is not None:
+            fcntl.flock(self.__file, fcntl.LOCK_UN)
+            self.__file.close()
+            self.__file = None
+
+        if self.__lease is not None and self.is_leader:
+            await database.repository.swap(
+                settings.LEADER_COLLECTION, self.name, self.__lease, {**self.__lease, 'expires': 0}
+            )
+            self.__lease = None
+
+        self.is_leader = False
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+PRESETS: Dict[str, Dict[str, List[str]]] = {
+    settings.CHAMPION_COLLECTION: {
+        'card': ['champ_id', 'name', 'title', 'icon', 'role', 'range_type'],
+        'stats-only': ['champ_id', 'name', 'stats'],
+        'build': ['champ_id', 'name', 'recommended_items', 'runes', 'items'],
+        'abilities': [
+            'champ_id', 'name', 'passive.name', 'passive.icon',
+            'spells.key', 'spells.name', 'spells.icon', 'spells.cooldown', 'spells.cost',
+        ],
+        'skin-cards': ['champ_id', 'name', 'skins.id', 'skins.name', 'skins.splash', 'skins.icon'],
+    },
+    settings.ITEM_COLLECTION: {
+        'card': ['item_id', 'name', 'icon', 'tags', 'gold.total'],
+        'stats-only': ['item_id', 'name', 'stats'],
+        'build': ['item_id', 'name', 'build_from', 'build_into', 'gold'],
+    },
+    settings.PERKS_COLLECTION: {
+        'card': ['name', 'icon', 'keystone.name', 'keystone.icon'],
+        'build': [
+            'name', 'icon', 'keystone.name', 'keystone.icon', 'slots.name', 'slots.runes.name', 'slots.runes.icon',
+        ],
+    },
+}
+
+
+def resolve(collection: str, fields: Optional[List[str]]) -> Optional[List[str]]:
+    if not fields:
+        return None
+
+    resolved: List[str] = []
+    for value in fields:
+        for field in value.split(','):
+            for path in PRESETS.get(collection, {}).get(field.strip(), [field.strip()]):
+                if path and path not in resolved:
+                    resolved.append(path)
+
+    return resolved or None
+
+
+def select_fields(fields: List[str]) -> List[str]:
+    return list(dict.fromkeys(field.split('.')[0] for field in fields))
+
+
+def build_tree(fields: List[str]) -> Optional[dict]:
+    if not any('.' in field for field in fields):
+        return None
+
+    tree: dict = {}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split('.')
+        for part in parents:
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+
+    return tree
+
+
+def project(value: Any, tree: dict) -> Any:
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: value[key] if node is None else project(value[key], node)
+            for key, node in tree.items() if key in value
+        }
+    return value
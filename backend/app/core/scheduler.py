@@ -6,8 +6,14 @@ class Scheduler:
     def __init__(self) -> None:
         self.__scheduler = AsyncIOScheduler()
 
-    def start(self) -> None:
-        self.__scheduler.start()
+    def start(self, paused: bool = False) -> None:
+        self.__scheduler.start(paused=paused)
+
+    def pause(self) -> None:
+        self.__scheduler.pause()
+
+    def resume(self) -> None:
+        self.__scheduler.resume()
 
     def shutdown(self) -> None:
         self.__scheduler.shutdown()
@@ -1,5 +1,252 @@
-def response_creation(message: str, _id: str) -> dict:
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.core.projection import build_tree, project, select_fields
+from app.db import database
+from app.repository import AlreadyExists, Filter
+
+logger = logging.getLogger(__name__)
+
+HASH_FIELD: str = '_hash'
+REF_FIELD: str = '_ref'
+SORT_FIELD: str = '_sort'
+INTERNAL_FIELDS: Tuple[str, ...] = (HASH_FIELD, REF_FIELD, SORT_FIELD)
+VERSION_PLACEHOLDER: str = '{version}'
+VERSIONED_URL = re.compile(
+    r'(https://(?:raw\.communitydragon\.org|ddragon\.leagueoflegends\.com/cdn)/)\d+\.\d+(\.\d+)?/'
+)
+
+
+def response_creation(message: str, _id: Optional[str]) -> dict:
     return {
         "_id": _id,
         "message": message,
     }
+
+
+def document_id(*values) -> str:
+    return ':'.join(str(value).replace('/', '_') for value in values)
+
+
+def rebase(value: Any, version: str) -> Any:
+    if isinstance(value, str):
+        return VERSIONED_URL.sub(lambda match: f"{match[1]}{version}{match[2] or ''}/", value)
+    if isinstance(value, list):
+        return [rebase(item, version) for item in value]
+    if isinstance(value, dict):
+        return {key: rebase(item, version) for key, item in value.items()}
+    return value
+
+
+def content_hash(data: dict, exclude: Tuple[str, ...]) -> str:
+    content = rebase({key: value for key, value in data.items() if key not in exclude}, VERSION_PLACEHOLDER)
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def finalize_document(
+        doc_id: str,
+        document: dict,
+        target: Optional[dict],
+        fields: Optional[List[str]],
+        tree: Optional[dict]
+) -> dict:
+    if target is not None:
+        document = {**(rebase(target, document['patch']) if document.get('patch') else target), **document}
+    for field in INTERNAL_FIELDS:
+        document.pop(field, None)
+    if fields and 'patch' not in select_fields(fields):
+        document.pop('patch', None)
+    if tree is not None:
+        document = project(document, tree)
+    document['id'] = doc_id
+    return document
+
+
+async def resolve_references(
+        collection: str,
+        documents: List[Tuple[str, dict]],
+        fields: Optional[List[str]] = None,
+        tree: Optional[dict] = None
+) -> List[dict]:
+    refs = list(dict.fromkeys(document[REF_FIELD] for _, document in documents if document.get(REF_FIELD)))
+
+    targets: Dict[str, dict] = {}
+    if refs:
+        targets = await database.repository.get_many(
+            collection, refs, list(dict.fromkeys([*select_fields(fields), 'patch'])) if fields else None
+        )
+
+    return [
+        finalize_document(
+            doc_id, document, targets.get(document[REF_FIELD], {}) if document.get(REF_FIELD) else None, fields, tree
+        )
+        for doc_id, document in documents
+    ]
+
+
+def page_key(cache_key: tuple, limit: Optional[int], start_after: Optional[str]) -> tuple:
+    return cache_key if limit is None and start_after is None else cache_key + (limit, start_after)
+
+
+async def stream_documents(
+        collection: str,
+        filters: List[Filter],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        start_after: Optional[str] = None
+) -> AsyncIterator[dict]:
+    select: Optional[List[str]] = None
+    tree: Optional[dict] = None
+    if fields:
+        select = list(dict.fromkeys([*select_fields(fields), REF_FIELD, 'patch']))
+        tree = build_tree(fields)
+
+    pending: List[Tuple[str, dict]] = []
+    references: int = 0
+    documents = database.repository.query(collection, filters, select, limit, start_after, ordered=limit is not None)
+    async for doc_id, document in documents:
+        if not pending and not document.get(REF_FIELD):
+            yield finalize_document(doc_id, document, None, fields, tree)
+            continue
+
+        pending.append((doc_id, document))
+        references += bool(document.get(REF_FIELD))
+        if references == settings.REFERENCE_CHUNK_SIZE:
+            for _doc in await resolve_references(collection, pending, fields, tree):
+                yield _doc
+            pending = []
+            references = 0
+
+    for _doc in await resolve_references(collection, pending, fields, tree):
+        yield _doc
+
+
+async def add_document(
+        collection: str,
+        data: dict,
+        keys: Tuple[str, ...],
+        id_keys: Optional[Tuple[str, ...]] = None
+) -> Optional[str]:
+    if settings.DETERMINISTIC_IDS:
+        _id = document_id(*(data[key] for key in id_keys or keys))
+        try:
+            await database.repository.create(collection, _id, data)
+        except AlreadyExists:
+            return None
+        read_cache.invalidate(collection, data[keys[0]])
+        return _id
+
+    filters: List[Filter] = [(key, '==', data[key]) for key in keys]
+    async for _ in database.repository.query(collection, filters, limit=1):
+        return None
+
+    _id = database.repository.new_id()
+    await database.repository.set(collection, _id, data)
+    read_cache.invalidate(collection, data[keys[0]])
+    return _id
+
+
+async def bulk_add(
+        collection: str,
+        records: List[BaseModel | dict],
+        schema: type[BaseModel],
+        keys: Tuple[str, ...],
+        describe: Callable[[BaseModel], str],
+        id_keys: Optional[Tuple[str, ...]] = None,
+        previous_patch: Optional[str] = None,
+        extra: Optional[Callable[[BaseModel], dict]] = None
+) -> List[dict]:
+    result: List[Optional[dict]] = []
+    documents: List[Tuple[int, BaseModel]] = []
+
+    for record in records:
+        try:
+            documents.append((len(result), record if isinstance(record, schema) else schema(**record)))
+            result.append(None)
+        except ValidationError as e:
+            result.append(response_creation(f"Invalid record: {e.errors(include_url=False, include_input=False)}", None))
+
+    if settings.DETERMINISTIC_IDS:
+        keys = id_keys or keys
+
+    existing: set = set()
+    if not settings.DETERMINISTIC_IDS:
+        for value in {getattr(document, keys[0]) for _, document in documents}:
+            docs = database.repository.query(collection, [(keys[0], '==', value)], list(keys))
+            async for _, doc in docs:
+                existing.add(tuple(doc.get(key) for key in keys))
+
+    incremental: bool = settings.INCREMENTAL_INGESTION and collection != settings.PATCH_COLLECTION
+    previous: Dict[tuple, Tuple[str, str]] = {}
+    if incremental and previous_patch is not None:
+        docs = database.repository.query(
+            collection, [(keys[0], '==', previous_patch)], [*keys[1:], HASH_FIELD, REF_FIELD]
+        )
+        async for _id, doc in docs:
+            if doc.get(HASH_FIELD):
+                previous[tuple(doc.get(key) for key in keys[1:])] = (doc[HASH_FIELD], doc.get(REF_FIELD) or _id)
+
+    pending: List[Tuple[int, BaseModel, dict]] = []
+    references: int = 0
+
+    async def create_one(index: int, document: BaseModel, data: dict) -> None:
+        _id = await add_document(collection, data, keys)
+        result[index] = response_creation(
+            f"{describe(document)} {'successfully added' if _id is not None else 'already exists'}.", _id
+        )
+
+    async def commit() -> None:
+        ids = [
+            document_id(*(data[key] for key in keys)) if settings.DETERMINISTIC_IDS else database.repository.new_id()
+            for _, _, data in pending
+        ]
+
+        try:
+            await database.repository.write_batch(
+                collection, [(_id, data) for _id, (_, _, data) in zip(ids, pending)], settings.DETERMINISTIC_IDS
+            )
+        except AlreadyExists:
+            await asyncio.gather(*(create_one(*entry) for entry in pending))
+        else:
+            for (index, document, _), _id in zip(pending, ids):
+                result[index] = response_creation(f"{describe(document)} successfully added.", _id)
+        for patch in {data[keys[0]] for _, _, data in pending}:
+            read_cache.invalidate(collection, patch)
+        pending.clear()
+
+    for index, document in documents:
+        key = tuple(getattr(document, k) for k in keys)
+        if key in existing:
+            result[index] = response_creation(f"{describe(document)} already exists.", None)
+            continue
+        existing.add(key)
+
+        data = document.dict()
+        if extra is not None:
+            data.update(extra(document))
+        if incremental:
+            data[HASH_FIELD] = content_hash(data, keys[:1])
+            entry = previous.get(key[1:])
+            if entry is not None and entry[0] == data[HASH_FIELD]:
+                data = {**{k: data[k] for k in keys}, HASH_FIELD: entry[0], REF_FIELD: entry[1]}
+                references += 1
+
+        pending.append((index, document, data))
+        if len(pending) == settings.FIRESTORE_BATCH_SIZE:
+            await commit()
+
+    if pending:
+        await commit()
+
+    if incremental and previous_patch is not None:
+        logger.info(f"{collection}: {references} unchanged records stored as references to patch {previous_patch}.")
+
+    return result
@@ -1,15 +1,17 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException
 
+from app.core.cache import read_cache
 from app.core.config import settings
-from app.crud import response_creation
+from app.crud import add_document, bulk_add, page_key, response_creation, stream_documents
 from app.crud.patch import Patch
-from app.db import firebase
 from app.schema.champion import ChampionCreate, GetChampion
 
 
 class Champion:
+    KEYS: tuple = ('patch', 'champ_id')
+
     def __init__(self, patch_version: str) -> None:
         self.patch_version: str = patch_version
 
@@ -20,62 +22,73 @@ class Champion:
 
         _champion: dict = champion.dict()
 
-        check_champ = (
-            firebase.db.collection(settings.CHAMPION_COLLECTION)
-            .where('patch', '==', champion.patch)
-            .where('champ_id', '==', champion.champ_id)
-            .limit(1)
-            .stream()
-        )
-        async for _ in check_champ:
+        _id = await add_document(settings.CHAMPION_COLLECTION, _champion, Champion.KEYS)
+        if _id is None:
             raise HTTPException(
                 400,
                 f'Champion {champion.champ_id} with patch version {champion.patch} already exists.'
             )
 
-        doc_ref = firebase.db.collection(settings.CHAMPION_COLLECTION).document()
-        await doc_ref.set(_champion)
-
         return response_creation(
             f"Champion {champion.champ_id} with patch version {champion.patch} successfully added.",
-            doc_ref.id
+            _id
+        )
+
+    @staticmethod
+    async def add_many(champions: List[ChampionCreate | dict], previous_patch: Optional[str] = None) -> List[dict]:
+        return await bulk_add(
+            settings.CHAMPION_COLLECTION,
+            champions,
+            ChampionCreate,
+            Champion.KEYS,
+            lambda champion: f"Champion {champion.champ_id} with patch version {champion.patch}",
+            previous_patch=previous_patch
         )
 
     @staticmethod
     async def get_list_champions() -> List[dict]:
-        result: List[dict] = []
         last_patch_version = await Patch.get_last_version()
 
-        docs = (
-            firebase.db.collection(settings.CHAMPION_COLLECTION)
-            .where('patch', '==', last_patch_version['version'])
-            .select(['name', 'champ_id'])
-            .stream()
-        )
+        cache_key = read_cache.key(settings.CHAMPION_COLLECTION, [last_patch_version['version']], ['name', 'champ_id'])
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        async for doc in docs:
-            _doc = doc.to_dict()
-            _doc['id'] = doc.id
-            result.append(_doc)
+        docs = stream_documents(
+            settings.CHAMPION_COLLECTION, [('patch', '==', last_patch_version['version'])], ['name', 'champ_id']
+        )
+        result: List[dict] = [doc async for doc in docs]
 
+        read_cache.set(cache_key, result)
         return result
 
-    async def get(self, fields: Optional[List[str]] = None) -> List[GetChampion]:
-        result: List[GetChampion] = []
+    def stream(
+            self,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        return stream_documents(
+            settings.CHAMPION_COLLECTION, [('patch', '==', self.patch_version)], fields, limit, start_after
+        )
 
-        docs = (
-            firebase.db.collection(settings.CHAMPION_COLLECTION)
-            .where('patch', '==', self.patch_version)
+    async def get(
+            self,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> List[GetChampion]:
+        cache_key = page_key(
+            read_cache.key(settings.CHAMPION_COLLECTION, [self.patch_version], fields), limit, start_after
         )
-        if fields:
-            docs = docs.select(fields)
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        async for doc in docs.stream():
-            _doc = doc.to_dict()
-            _doc['id'] = doc.id
-            result.append(_doc)
+        result: List[GetChampion] = [doc async for doc in self.stream(fields, limit, start_after)]
 
-        if not result:
+        if not result and start_after is None:
             raise HTTPException(400, f"No data found in patch {self.patch_version}.")
 
+        read_cache.set(cache_key, result)
         return result
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.crud import rebase
+from app.crud.champion import Champion
+from app.crud.item import Item
+from app.crud.perks import Perks
+
+IGNORED_FIELDS: tuple = ('id', 'patch')
+IDENTITY_FIELDS: tuple = ('key', 'id', 'name')
+
+
+def identity(*lists: List[Any]) -> Optional[str]:
+    if not any(lists) or not all(isinstance(value, dict) for values in lists for value in values):
+        return None
+
+    for field in IDENTITY_FIELDS:
+        if all(
+                None not in (keys := [value.get(field) for value in values]) and len(set(map(str, keys))) == len(keys)
+                for values in lists
+        ):
+            return field
+    return None
+
+
+def compare(before: Any, after: Any) -> Optional[Any]:
+    if before == after:
+        return None
+
+    if isinstance(before, dict) and isinstance(after, dict):
+        changes = {
+            key: change for key in dict.fromkeys([*before, *after])
+            if (change := compare(before.get(key), after.get(key))) is not None
+        }
+        return changes or None
+
+    if isinstance(before, list) and isinstance(after, list):
+        field = identity(before, after)
+        if field is not None:
+            return compare(
+                {str(value[field]): value for value in before},
+                {str(value[field]): value for value in after}
+            )
+
+    return {'from': before, 'to': after}
+
+
+class Diff:
+    COLLECTIONS: Dict[str, type] = {
+        settings.CHAMPION_COLLECTION: Champion,
+        settings.ITEM_COLLECTION: Item,
+        settings.PERKS_COLLECTION: Perks,
+    }
+
+    def __init__(self, collection: str, from_patch: str, to_patch: str) -> None:
+        if collection not in Diff.COLLECTIONS:
+            raise HTTPException(400, f"Collection {collection} cannot be diffed.")
+
+        self.__collection: str = collection
+        self.__patches: List[str] = [from_patch, to_patch]
+
+    async def get(self) -> dict:
+        cache_key = read_cache.key(self.__collection, self.__patches, ['diff'])
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        crud = Diff.COLLECTIONS[self.__collection]
+        key: str = crud.KEYS[1]
+        before, after = (
+            {document[key]: document for document in documents}
+            for documents in await asyncio.gather(*(crud(patch).get() for patch in self.__patches))
+        )
+
+        changed: List[dict] = []
+        for value in before.keys() & after.keys():
+            previous = {field: data for field, data in before[value].items() if field not in IGNORED_FIELDS}
+            changes = compare(
+                rebase(previous, self.__patches[1]),
+                {field: data for field, data in after[value].items() if field not in IGNORED_FIELDS}
+            )
+            if changes is not None:
+                changed.append({key: value, 'name': after[value].get('name'), 'changes': changes})
+
+        result: dict = {
+            'collection': self.__collection,
+            'from': self.__patches[0],
+            'to': self.__patches[1],
+            'added': [after[value] for value in after.keys() - before.keys()],
+            'removed': [{key: value, 'name': before[value].get('name')} for value in before.keys() - after.keys()],
+            'changed': sorted(changed, key=lambda change: str(change[key])),
+        }
+
+        read_cache.set(cache_key, result)
+        return result
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.crud import document_id
+from app.db import database
+
+
+class ETag:
+    @staticmethod
+    def compute(content: Any) -> str:
+        return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def variant(
+            etag: str,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> str:
+        if fields:
+            etag = f"{etag}-{hashlib.sha256(','.join(sorted(fields)).encode()).hexdigest()[:8]}"
+        if limit is not None or start_after is not None:
+            etag = f"{etag}-p{hashlib.sha256(f'{limit}:{start_after}'.encode()).hexdigest()[:8]}"
+        return f'"{etag}"'
+
+    @staticmethod
+    def encoded(etag: str, encoding: Optional[str]) -> str:
+        return f'{etag[:-1]}-{encoding}"' if encoding is not None else etag
+
+    @staticmethod
+    async def set(collection: str, patch: str, etag: str) -> None:
+        await database.repository.set(settings.ETAG_COLLECTION, document_id(collection, patch), {
+            'collection': collection,
+            'patch': patch,
+            'etag': etag,
+            'creation_date': datetime.now(),
+        })
+        read_cache.invalidate(settings.ETAG_COLLECTION, patch)
+
+    @staticmethod
+    async def get(collection: str, patch: str) -> Optional[str]:
+        cache_key = read_cache.key(settings.ETAG_COLLECTION, [patch], [collection])
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached or None
+
+        doc = await database.repository.get(settings.ETAG_COLLECTION, document_id(collection, patch), ['etag'])
+        etag: str = doc.get('etag', '') if doc is not None else ''
+
+        read_cache.set(cache_key, etag)
+        return etag or None
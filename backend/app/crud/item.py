@@ -1,14 +1,17 @@
-from typing import Optional, List
+from typing import AsyncIterator, List, Optional
 
 from fastapi import HTTPException
 
+from app.core.cache import read_cache
 from app.core.config import settings
-from app.crud import response_creation
-from app.db import firebase
+from app.crud import add_document, bulk_add, page_key, response_creation, stream_documents
 from app.schema.item import ItemSchema
 
 
 class Item:
+    KEYS: tuple = ('patch', 'name')
+    ID_KEYS: tuple = ('patch', 'item_id')
+
     def __init__(self, patch_version: str) -> None:
         self.__patch_version: str = patch_version
 
@@ -19,43 +22,57 @@ class Item:
 
         _item: dict = item.dict()
 
-        check_item = (
-            firebase.db.collection(settings.ITEM_COLLECTION)
-            .where('patch', '==', item.patch)
-            .where('name', '==', item.name)
-            .limit(1)
-            .stream()
-        )
-        async for _ in check_item:
+        _id = await add_document(settings.ITEM_COLLECTION, _item, Item.KEYS, Item.ID_KEYS)
+        if _id is None:
             raise HTTPException(
                 400,
                 f"Item {item.name} with patch version {item.patch} already exists."
             )
 
-        doc_ref = firebase.db.collection(settings.ITEM_COLLECTION).document()
-        await doc_ref.set(_item)
-
         return response_creation(
             f"Item {item.name} with patch version {item.patch} successfully added.",
-            doc_ref.id
+            _id
         )
 
-    async def get(self, fields: Optional[List[str]] = None):
-        result: list[dict] = []
+    @staticmethod
+    async def add_many(items: List[ItemSchema | dict], previous_patch: Optional[str] = None) -> List[dict]:
+        return await bulk_add(
+            settings.ITEM_COLLECTION,
+            items,
+            ItemSchema,
+            Item.KEYS,
+            lambda item: f"Item {item.name} with patch version {item.patch}",
+            Item.ID_KEYS,
+            previous_patch=previous_patch
+        )
+
+    def stream(
+            self,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        return stream_documents(
+            settings.ITEM_COLLECTION, [('patch', '==', self.__patch_version)], fields, limit, start_after
+        )
 
-        docs = (
-            firebase.db.collection(settings.ITEM_COLLECTION)
-            .where('patch', '==', self.__patch_version)
+    async def get(
+            self,
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ):
+        cache_key = page_key(
+            read_cache.key(settings.ITEM_COLLECTION, [self.__patch_version], fields), limit, start_after
         )
-        if fields:
-            docs = docs.select(fields)
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        async for doc in docs.stream():
-            _doc = doc.to_dict()
-            _doc['id'] = doc.id
-            result.append(_doc)
+        result: list[dict] = [doc async for doc in self.stream(fields, limit, start_after)]
 
-        if not result:
+        if not result and start_after is None:
             raise HTTPException(400, f"No data found in patch {self.__patch_version}.")
 
+        read_cache.set(cache_key, result)
         return result
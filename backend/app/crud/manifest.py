@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from app.core.config import settings
+from app.db import database
+
+
+class Manifest:
+    def __init__(self, version: str) -> None:
+        self.version: str = version
+        self.stages: Dict[str, bool] = {}
+        self.entities: Dict[str, List[str]] = {}
+        self.failed: Dict[str, List[str]] = {}
+        self.complete: bool = False
+
+    async def __update(self, data: dict) -> None:
+        await database.repository.set(settings.MANIFEST_COLLECTION, self.version, {
+            'version': self.version,
+            **data,
+            'update_date': datetime.now(),
+        }, merge=True)
+
+    async def load(self) -> 'Manifest':
+        data = await database.repository.get(settings.MANIFEST_COLLECTION, self.version)
+        if data is not None:
+            self.stages = data.get('stages', {})
+            self.entities = data.get('entities', {})
+            self.failed = data.get('failed', {})
+            self.complete = data.get('complete', False)
+        return self
+
+    async def stage_done(self, name: str) -> None:
+        self.stages[name] = True
+        await self.__update({'stages': {name: True}})
+
+    async def entities_done(self, stage: str, names: Iterable[str]) -> None:
+        names = list(names)
+        self.entities.setdefault(stage, []).extend(names)
+        await database.repository.append(settings.MANIFEST_COLLECTION, self.version, f"entities.{stage}", names)
+
+    async def entities_failed(self, stage: str, names: Iterable[str]) -> None:
+        self.failed[stage] = list(names)
+        await self.__update({'failed': {stage: self.failed[stage]}})
+
+    async def mark_complete(self) -> None:
+        self.complete = True
+        await self.__update({'complete': True})
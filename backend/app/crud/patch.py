@@ -1,90 +1,166 @@
-from typing import List, Optional
+import asyncio
+import re
+import time
+from typing import AsyncIterator, List, Optional, Tuple
 
 from fastapi import HTTPException
 
+from app.core.cache import read_cache
 from app.core.config import settings
-from app.crud import response_creation
-from app.db import firebase
+from app.crud import (
+    INTERNAL_FIELDS, SORT_FIELD, add_document, bulk_add, page_key, response_creation, stream_documents
+)
+from app.db import database
 from app.schema.patch import PatchSchema
 
 
 class Patch:
+    KEYS: tuple = ('version',)
+    __last_version: Optional[dict] = None
+    __last_version_expiry: float = 0
+    __indexed: bool = False
+
     def __init__(self, versions: list | str):
-        self.versions = [versions] if isinstance(versions, str) else versions
+        self.versions = [versions] if isinstance(versions, str) else list(dict.fromkeys(versions))
 
     @staticmethod
     async def add(patch: PatchSchema | dict):
         if isinstance(patch, dict):
             patch = PatchSchema(**patch)
 
-        _patch: dict = patch.dict()
+        await Patch.index_versions()
+        _patch: dict = {**patch.dict(), SORT_FIELD: Patch.sort_key(patch.version)}
 
-        check_patch = (
-            firebase.db.collection(settings.PATCH_COLLECTION)
-            .where('version', '==', patch.version)
-            .limit(1)
-            .stream()
-        )
-        async for _ in check_patch:
+        _id = await add_document(settings.PATCH_COLLECTION, _patch, Patch.KEYS)
+        if _id is None:
             raise HTTPException(400, f"Patch version {patch.version} already exists.")
 
-        doc_ref = firebase.db.collection(settings.PATCH_COLLECTION).document()
-        await doc_ref.set(_patch)
-
         return response_creation(
             f"Patch version {patch.version} successfully added.",
-            doc_ref.id
+            _id
         )
 
     @staticmethod
-    async def get_all_patch(fields: Optional[List[str]] = None) -> List[dict]:
-        result: list[dict] = []
-
-        docs = (
-            firebase.db.collection(settings.PATCH_COLLECTION)
+    async def add_many(patches: List[PatchSchema | dict]) -> List[dict]:
+        await Patch.index_versions()
+        return await bulk_add(
+            settings.PATCH_COLLECTION,
+            patches,
+            PatchSchema,
+            Patch.KEYS,
+            lambda patch: f"Patch version {patch.version}",
+            extra=lambda patch: {SORT_FIELD: Patch.sort_key(patch.version)}
         )
-        if fields:
-            docs = docs.select(fields)
 
-        async for document in docs.stream():
-            _doc = document.to_dict()
-            _doc["id"] = document.id
-            result.append(_doc)
+    @staticmethod
+    def stream_all_patch(
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        return stream_documents(settings.PATCH_COLLECTION, [], fields, limit, start_after)
 
+    @staticmethod
+    async def get_all_patch(
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None
+    ) -> List[dict]:
+        cache_key = page_key(read_cache.key(settings.PATCH_COLLECTION, None, fields), limit, start_after)
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result: list[dict] = [doc async for doc in Patch.stream_all_patch(fields, limit, start_after)]
+
+        read_cache.set(cache_key, result, ttl=settings.PATCH_LIST_TTL)
         return result
 
+    @staticmethod
+    def version_key(version: str) -> Tuple[int, ...]:
+        return tuple(int(number) for number in re.findall(r'\d+', version))
+
+    @staticmethod
+    def sort_key(version: str) -> str:
+        return '.'.join(f"{number:06d}" for number in Patch.version_key(version))
+
+    @staticmethod
+    async def index_versions() -> None:
+        if Patch.__indexed:
+            return
+
+        docs = database.repository.query(settings.PATCH_COLLECTION, fields=['version', SORT_FIELD])
+        async for _id, doc in docs:
+            if doc.get(SORT_FIELD) is None and doc.get('version'):
+                await database.repository.set(
+                    settings.PATCH_COLLECTION, _id, {SORT_FIELD: Patch.sort_key(doc['version'])}, merge=True
+                )
+        Patch.__indexed = True
+
     @staticmethod
     async def get_last_version() -> dict:
-        docs = (
-            firebase.db.collection(settings.PATCH_COLLECTION)
-            .order_by('creation_date', direction='DESCENDING')
-            .limit(1)
-            .select(['version'])
-            .stream()
-        )
+        if Patch.__last_version is not None and time.monotonic() < Patch.__last_version_expiry:
+            return Patch.__last_version
+
+        return await Patch.refresh_last_version()
 
-        async for doc in docs:
-            return {
-                "id": doc.id,
-                "version": doc.get('version')
+    @staticmethod
+    async def refresh_last_version() -> Optional[dict]:
+        last_version: Optional[dict] = None
+        docs = database.repository.query(
+            settings.PATCH_COLLECTION, fields=['version'], limit=1, order_by=SORT_FIELD, descending=True
+        )
+        async for _id, doc in docs:
+            last_version = {
+                "id": _id,
+                "version": doc['version']
             }
 
-    async def get(self, fields: Optional[List[str]] = None) -> List[dict]:
-        result: list[dict] = []
+        if last_version is None:
+            async for _id, doc in database.repository.query(settings.PATCH_COLLECTION, fields=['version']):
+                version = doc.get('version')
+                if last_version is None or Patch.version_key(version) > Patch.version_key(last_version['version']):
+                    last_version = {
+                        "id": _id,
+                        "version": version
+                    }
 
-        docs = (
-            firebase.db.collection(settings.PATCH_COLLECTION)
-            .where('version', 'in', self.versions)
-        )
-        if fields:
-            docs = docs.select(fields)
+        Patch.__last_version = last_version
+        Patch.__last_version_expiry = time.monotonic() + settings.LAST_VERSION_TTL
+        return last_version
 
-        async for document in docs.stream():
-            _doc = document.to_dict()
-            _doc["id"] = document.id
-            result.append(_doc)
+    @staticmethod
+    def expire_last_version() -> None:
+        Patch.__last_version_expiry = 0
+
+    async def get(self, fields: Optional[List[str]] = None) -> List[dict]:
+        cache_key = read_cache.key(settings.PATCH_COLLECTION, self.versions, fields)
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        select = [*fields, 'version'] if fields and 'version' not in fields else fields
+
+        async def query(versions: List[str]) -> List[dict]:
+            docs = database.repository.query(settings.PATCH_COLLECTION, [('version', 'in', versions)], select)
+            return [
+                {**{key: value for key, value in _doc.items() if key not in INTERNAL_FIELDS}, "id": _id}
+                async for _id, _doc in docs
+            ]
+
+        size = settings.PATCH_QUERY_CHUNK_SIZE
+        chunks = await asyncio.gather(*(
+            query(self.versions[index:index + size]) for index in range(0, len(self.versions), size)
+        ))
+
+        order = {version: index for index, version in enumerate(self.versions)}
+        result: list[dict] = sorted((doc for chunk in chunks for doc in chunk), key=lambda doc: order[doc['version']])
+        if select is not fields:
+            for doc in result:
+                doc.pop('version')
 
         if not result:
             raise HTTPException(400, f"Patch {', '.join(self.versions)} does not exists.")
 
+        read_cache.set(cache_key, result)
         return result
@@ -1,12 +1,15 @@
+from typing import List, Optional
+
 from fastapi import HTTPException
 
 from app.core.config import settings
-from app.crud import response_creation
-from app.db import firebase
+from app.crud import add_document, bulk_add, response_creation
 from app.schema.shard import ShardSchema
 
 
 class Shard:
+    KEYS: tuple = ('patch', 'name')
+
     @staticmethod
     async def add(shard: ShardSchema | dict):
         if isinstance(shard, dict):
@@ -14,24 +17,25 @@ class Shard:
 
         _shard: dict = shard.dict()
 
-        check_shard = (
-            firebase.db.collection(settings.SHARD_COLLECTION)
-            .where('patch', '==', shard.patch)
-            .where('name', '==', shard.name)
-            .limit(1)
-            .stream()
-        )
-
-        async for _ in check_shard:
+        _id = await add_document(settings.SHARD_COLLECTION, _shard, Shard.KEYS)
+        if _id is None:
             raise HTTPException(
                 400,
                 f"Shard {shard.name} with patch version {shard.patch} already exists."
             )
 
-        doc_ref = firebase.db.collection(settings.SHARD_COLLECTION).document()
-        await doc_ref.set(_shard)
-
         return response_creation(
             f"Shard {shard.name} with patch version {shard.patch} successfully added.",
-            doc_ref.id
+            _id
+        )
+
+    @staticmethod
+    async def add_many(shards: List[ShardSchema | dict], previous_patch: Optional[str] = None) -> List[dict]:
+        return await bulk_add(
+            settings.SHARD_COLLECTION,
+            shards,
+            ShardSchema,
+            Shard.KEYS,
+            lambda shard: f"Shard {shard.name} with patch version {shard.patch}",
+            previous_patch=previous_patch
         )
@@ -0,0 +1,66 @@
+import asyncio
+import gzip
+from typing import List, Optional
+
+from firebase_admin import storage
+from google.api_core.exceptions import NotFound
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.core.serialization import dump_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Snapshot:
+    @staticmethod
+    def encodings() -> List[str]:
+        return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    @staticmethod
+    def compress(content: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(content, quality=11)
+        return gzip.compress(content, compresslevel=9)
+
+    @staticmethod
+    def path(collection: str, patch: str, encoding: str) -> str:
+        return f"{settings.SNAPSHOT_PREFIX}/{collection}/{patch}.json.{'br' if encoding == 'br' else 'gz'}"
+
+    @staticmethod
+    async def save(collection: str, patch: str, documents: List[dict]) -> None:
+        if not settings.SNAPSHOT_BUCKET:
+            return
+
+        bucket = storage.bucket(settings.SNAPSHOT_BUCKET)
+        content = dump_json(documents)
+
+        for encoding in Snapshot.encodings():
+            blob = bucket.blob(Snapshot.path(collection, patch, encoding))
+            await asyncio.to_thread(
+                blob.upload_from_string, Snapshot.compress(content, encoding), content_type='application/octet-stream'
+            )
+
+        read_cache.invalidate(settings.SNAPSHOT_PREFIX, patch)
+
+    @staticmethod
+    async def get(collection: str, patch: str, encoding: str) -> Optional[bytes]:
+        if not settings.SNAPSHOT_BUCKET:
+            return None
+
+        cache_key = read_cache.key(settings.SNAPSHOT_PREFIX, [patch], [collection, encoding])
+        cached = read_cache.get(cache_key)
+        if cached is not None:
+            return cached or None
+
+        blob = storage.bucket(settings.SNAPSHOT_BUCKET).blob(Snapshot.path(collection, patch, encoding))
+        try:
+            content = await asyncio.to_thread(blob.download_as_bytes, raw_download=True)
+        except NotFound:
+            content = b''
+
+        read_cache.set(cache_key, content, len(content))
+        return content or None
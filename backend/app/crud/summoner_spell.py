@@ -1,12 +1,15 @@
+from typing import List, Optional
+
 from fastapi import HTTPException
 
 from app.core.config import settings
-from app.crud import response_creation
-from app.db import firebase
+from app.crud import add_document, bulk_add, response_creation
 from app.schema.summoner_spell import SummonerSpellSchema
 
 
 class SummonerSpell:
+    KEYS: tuple = ('patch', 'name')
+
     @staticmethod
     async def add(summoner_spell: SummonerSpellSchema | dict):
         if isinstance(summoner_spell, dict):
@@ -14,23 +17,28 @@ class SummonerSpell:
 
         _summoner_spell: dict = summoner_spell.dict()
 
-        check_summoner_spell = (
-            firebase.db.collection(settings.SUMMONER_SPELL_COLLECTION)
-            .where('patch', '==', summoner_spell.patch)
-            .where('name', '==', summoner_spell.name)
-            .limit(1)
-            .stream()
-        )
-        async for _ in check_summoner_spell:
+        _id = await add_document(settings.SUMMONER_SPELL_COLLECTION, _summoner_spell, SummonerSpell.KEYS)
+        if _id is None:
             raise HTTPException(
                 400,
                 f"Summoner spell {summoner_spell.name} with patch version {summoner_spell.patch} already exists."
             )
 
-        doc_ref = firebase.db.collection(settings.SUMMONER_SPELL_COLLECTION).document()
-        await doc_ref.set(_summoner_spell)
-
         return response_creation(
             f"Summoner spell {summoner_spell.name} with patch version {summoner_spell.patch} successfully added.",
-            doc_ref.id
+            _id
+        )
+
+    @staticmethod
+    async def add_many(
+            summoner_spells: List[SummonerSpellSchema | dict],
+            previous_patch: Optional[str] = None
+    ) -> List[dict]:
+        return await bulk_add(
+            settings.SUMMONER_SPELL_COLLECTION,
+            summoner_spells,
+            SummonerSpellSchema,
+            SummonerSpell.KEYS,
+            lambda summoner_spell: f"Summoner spell {summoner_spell.name} with patch version {summoner_spell.patch}",
+            previous_patch=previous_patch
         )
@@ -1,12 +1,28 @@
-from firebase_admin import credentials, initialize_app
+from typing import Optional
+
+from firebase_admin import credentials, firestore_async, initialize_app
 
 from app.core.config import settings
+from app.repository import Repository
+from app.repository.firestore import FirestoreRepository
+from app.repository.replica import ReplicaRepository
+from app.repository.sqlite import SQLiteRepository
+
+
+class Database:
+    repository: Optional[Repository] = None
 
 
-class Firebase:
-    db = None
+def connect() -> Repository:
+    if settings.STORAGE_BACKEND == 'sqlite':
+        database.repository = SQLiteRepository(settings.SQLITE_PATH)
+    else:
+        database.repository = FirestoreRepository(firestore_async.client())
+        if settings.READ_REPLICA:
+            database.repository = ReplicaRepository(database.repository, SQLiteRepository(settings.READ_REPLICA_PATH))
+    return database.repository
 
 
-cred = credentials.Certificate(settings.CERTIFICATE.dict())
-initialize_app(cred)
-firebase = Firebase()
+if settings.CERTIFICATE is not None:
+    initialize_app(credentials.Certificate(settings.CERTIFICATE.dict()))
+database = Database()
@@ -1,24 +1,38 @@
+import asyncio
 from apscheduler.triggers.cron import CronTrigger
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI
-from firebase_admin import firestore_async
 
 from app.core.config import settings
+from app.core.http_client import http_client
 from app.core.job_scripts.patch_release import patch_release
-from app.db import firebase
+from app.db import connect, database
 from app.routers.main import api_router
-from app.scheduler import scheduler
+from app.scheduler import leader, scheduler
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    sync = asyncio.create_task(database.repository.sync())
+    leader.start(scheduler.resume, scheduler.pause)
+    yield
+    sync.cancel()
+    await leader.stop()
+    http_client.close()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1}/openai.json",
+    lifespan=lifespan,
 )
 
-firebase.db = firestore_async.client()
+connect()
 
 app.include_router(api_router, prefix=settings.API_V1)
 
-scheduler.start()
+scheduler.start(paused=True)
 if not scheduler.get_job(settings.JOB_RELEASE_PATCH):
     scheduler.add_job(patch_release, CronTrigger(day='*', start_date=datetime.now()), settings.JOB_RELEASE_PATCH)
 
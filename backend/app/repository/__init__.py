@@ -0,0 +1,69 @@
+import random
+import string
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+Filter = Tuple[str, str, Any]
+
+
+class AlreadyExists(Exception):
+    pass
+
+
+class Repository(ABC):
+    @staticmethod
+    def new_id() -> str:
+        return ''.join(random.choices(string.ascii_letters + string.digits, k=20))
+
+    async def sync(self, versions: Optional[List[str]] = None) -> List[str]:
+        return []
+
+    async def reload(self) -> None:
+        pass
+
+    @abstractmethod
+    async def create(self, collection: str, doc_id: str, data: dict) -> None:
+        ...
+
+    @abstractmethod
+    async def set(self, collection: str, doc_id: str, data: dict, merge: bool = False) -> None:
+        ...
+
+    @abstractmethod
+    async def swap(self, collection: str, doc_id: str, expected: Optional[dict], data: dict) -> bool:
+        ...
+
+    @abstractmethod
+    async def append(self, collection: str, doc_id: str, field: str, values: List[Any]) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, collection: str, doc_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def get_many(
+            self,
+            collection: str,
+            doc_ids: Sequence[str],
+            fields: Optional[List[str]] = None
+    ) -> Dict[str, dict]:
+        ...
+
+    @abstractmethod
+    def query(
+            self,
+            collection: str,
+            filters: Sequence[Filter] = (),
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None,
+            ordered: bool = False,
+            order_by: Optional[str] = None,
+            descending: bool = False
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        ...
+
+    @abstractmethod
+    async def write_batch(self, collection: str, documents: List[Tuple[str, dict]], create: bool = False) -> None:
+        ...
@@ -0,0 +1,101 @@
+from functools import reduce
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from google.api_core import exceptions
+from google.cloud.firestore_v1 import ArrayUnion, Query
+from google.cloud.firestore_v1.async_transaction import async_transactional
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from app.repository import AlreadyExists, Filter, Repository
+
+
+class FirestoreRepository(Repository):
+    def __init__(self, client) -> None:
+        self.__client = client
+
+    def __document(self, collection: str, doc_id: str):
+        return self.__client.collection(collection).document(doc_id)
+
+    async def create(self, collection: str, doc_id: str, data: dict) -> None:
+        try:
+            await self.__document(collection, doc_id).create(data)
+        except exceptions.AlreadyExists as e:
+            raise AlreadyExists(doc_id) from e
+
+    async def set(self, collection: str, doc_id: str, data: dict, merge: bool = False) -> None:
+        await self.__document(collection, doc_id).set(data, merge=merge)
+
+    async def swap(self, collection: str, doc_id: str, expected: Optional[dict], data: dict) -> bool:
+        ref = self.__document(collection, doc_id)
+
+        @async_transactional
+        async def run(transaction) -> bool:
+            doc = await ref.get(transaction=transaction)
+            if (doc.to_dict() if doc.exists else None) != expected:
+                return False
+            transaction.set(ref, data)
+            return True
+
+        return await run(self.__client.transaction())
+
+    async def append(self, collection: str, doc_id: str, field: str, values: List[Any]) -> None:
+        data = reduce(lambda value, key: {key: value}, reversed(field.split('.')), ArrayUnion(values))
+        await self.__document(collection, doc_id).set(data, merge=True)
+
+    async def get(self, collection: str, doc_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        doc = await self.__document(collection, doc_id).get(field_paths=fields)
+        return doc.to_dict() if doc.exists else None
+
+    async def get_many(
+            self,
+            collection: str,
+            doc_ids: Sequence[str],
+            fields: Optional[List[str]] = None
+    ) -> Dict[str, dict]:
+        result: Dict[str, dict] = {}
+        refs = [self.__document(collection, doc_id) for doc_id in doc_ids]
+        async for doc in self.__client.get_all(refs, field_paths=fields):
+            if doc.exists:
+                result[doc.id] = doc.to_dict() or {}
+        return result
+
+    async def query(
+            self,
+            collection: str,
+            filters: Sequence[Filter] = (),
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None,
+            ordered: bool = False,
+            order_by: Optional[str] = None,
+            descending: bool = False
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        query = self.__client.collection(collection)
+        for field, op, value in filters:
+            query = query.where(field, op, value)
+        if fields:
+            query = query.select(fields)
+        if order_by is not None:
+            query = query.order_by(order_by, direction=Query.DESCENDING if descending else Query.ASCENDING)
+        if ordered or start_after is not None:
+            query = query.order_by(FieldPath.document_id())
+        if start_after is not None:
+            query = query.start_after({FieldPath.document_id(): start_after})
+        if limit is not None:
+            query = query.limit(limit)
+
+        async for doc in query.stream():
+            yield doc.id, doc.to_dict()
+
+    async def write_batch(self, collection: str, documents: List[Tuple[str, dict]], create: bool = False) -> None:
+        batch = self.__client.batch()
+        for doc_id, data in documents:
+            if create:
+                batch.create(self.__document(collection, doc_id), data)
+            else:
+                batch.set(self.__document(collection, doc_id), data)
+
+        try:
+            await batch.commit()
+        except exceptions.AlreadyExists as e:
+            raise AlreadyExists(collection) from e
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.core.config import settings
+from app.repository import Filter, Repository
+
+logger = logging.getLogger(__name__)
+
+STATE_COLLECTION: str = '_replica'
+STATE_DOCUMENT: str = 'versions'
+
+
+class ReplicaRepository(Repository):
+    def __init__(self, primary: Repository, replica: Repository) -> None:
+        self.__primary = primary
+        self.__replica = replica
+        self.__collections: Tuple[str, ...] = (
+            settings.PATCH_COLLECTION,
+            settings.CHAMPION_COLLECTION,
+            settings.ITEM_COLLECTION,
+            settings.PERKS_COLLECTION,
+            settings.SUMMONER_SPELL_COLLECTION,
+            settings.SHARD_COLLECTION,
+            settings.ETAG_COLLECTION,
+        )
+        self.__versions: Set[str] = set()
+        self.__loaded: bool = False
+        self.__attempts: Dict[str, float] = {}
+        self.__tasks: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def __key(collection: str) -> str:
+        return 'version' if collection == settings.PATCH_COLLECTION else 'patch'
+
+    def __filtered_versions(self, collection: str, filters: Sequence[Filter]) -> List[str]:
+        if collection not in self.__collections:
+            return []
+        for field, op, value in filters:
+            if field == self.__key(collection):
+                return [value] if op == '==' else list(value)
+        return []
+
+    def __synced(self, collection: str, data: dict) -> bool:
+        return collection in self.__collections and data.get(self.__key(collection)) in self.__versions
+
+    def __schedule(self, version: str) -> None:
+        now = time.monotonic()
+        if version in self.__versions or version in self.__tasks or now < self.__attempts.get(version, 0):
+            return
+
+        self.__attempts = {key: expiry for key, expiry in self.__attempts.items() if expiry > now}
+        self.__attempts[version] = now + settings.READ_REPLICA_RETRY
+        task = asyncio.create_task(self.sync([version]))
+        task.add_done_callback(lambda _: self.__tasks.pop(version, None))
+        self.__tasks[version] = task
+
+    async def __copy(self, collection: str, filters: List[Filter]) -> int:
+        count = 0
+        chunk: List[Tuple[str, dict]] = []
+        async for doc in self.__primary.query(collection, filters):
+            chunk.append(doc)
+            if len(chunk) == settings.FIRESTORE_BATCH_SIZE:
+                await self.__replica.write_batch(collection, chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            await self.__replica.write_batch(collection, chunk)
+            count += len(chunk)
+        return count
+
+    async def sync_version(self, version: str) -> bool:
+        patches = [doc async for doc in self.__primary.query(settings.PATCH_COLLECTION, [('version', '==', version)])]
+        if not patches:
+            return False
+
+        start = time.perf_counter()
+        count = 0
+        for collection in self.__collections[1:]:
+            count += await self.__copy(collection, [('patch', '==', version)])
+        await self.__replica.write_batch(settings.PATCH_COLLECTION, patches)
+        await self.__replica.append(STATE_COLLECTION, STATE_DOCUMENT, 'versions', [version])
+        self.__versions.add(version)
+
+        logger.info(f"Read replica: patch {version} synced, {count} documents in {time.perf_counter() - start:.1f}s.")
+        return True
+
+    async def reload(self) -> None:
+        state = await self.__replica.get(STATE_COLLECTION, STATE_DOCUMENT)
+        self.__versions.update(state['versions'] if state else [])
+        self.__loaded = True
+
+    async def sync(self, versions: Optional[List[str]] = None) -> List[str]:
+        if not self.__loaded:
+            await self.reload()
+
+        if versions is None:
+            docs = self.__primary.query(settings.PATCH_COLLECTION, fields=['version'])
+            versions = [doc['version'] async for _, doc in docs]
+
+        synced: List[str] = []
+        for version in versions:
+            if version in self.__versions:
+                continue
+            try:
+                if await self.sync_version(version):
+                    synced.append(version)
+            except Exception:
+                logger.exception(f"Read replica: patch {version} sync failed.")
+        return synced
+
+    async def create(self, collection: str, doc_id: str, data: dict) -> None:
+        await self.__primary.create(collection, doc_id, data)
+        if self.__synced(collection, data):
+            await self.__replica.set(collection, doc_id, data)
+
+    async def set(self, collection: str, doc_id: str, data: dict, merge: bool = False) -> None:
+        await self.__primary.set(collection, doc_id, data, merge)
+        if self.__synced(collection, data):
+            await self.__replica.set(collection, doc_id, data, merge)
+
+    async def swap(self, collection: str, doc_id: str, expected: Optional[dict], data: dict) -> bool:
+        return await self.__primary.swap(collection, doc_id, expected, data)
+
+    async def append(self, collection: str, doc_id: str, field: str, values: List[Any]) -> None:
+        await self.__primary.append(collection, doc_id, field, values)
+
+    async def get(self, collection: str, doc_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        if collection in self.__collections:
+            document = await self.__replica.get(collection, doc_id, fields)
+            if document is not None:
+                return document
+        return await self.__primary.get(collection, doc_id, fields)
+
+    async def get_many(
+            self,
+            collection: str,
+            doc_ids: Sequence[str],
+            fields: Optional[List[str]] = None
+    ) -> Dict[str, dict]:
+        result: Dict[str, dict] = {}
+        if collection in self.__collections:
+            result = await self.__replica.get_many(collection, doc_ids, fields)
+
+        missing = [doc_id for doc_id in doc_ids if doc_id not in result]
+        if missing:
+            result.update(await self.__primary.get_many(collection, missing, fields))
+        return result
+
+    async def query(
+            self,
+            collection: str,
+            filters: Sequence[Filter] = (),
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None,
+            ordered: bool = False,
+            order_by: Optional[str] = None,
+            descending: bool = False
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        versions = self.__filtered_versions(collection, filters)
+        pending = {version for version in versions if version not in self.__versions}
+        source = self.__replica if versions and not pending else self.__primary
+
+        async for doc in source.query(
+                collection, filters, fields, limit, start_after, ordered, order_by, descending
+        ):
+            if pending:
+                version = versions[0] if len(versions) == 1 else doc[1].get(self.__key(collection))
+                if version in pending:
+                    self.__schedule(version)
+            yield doc
+
+    async def write_batch(self, collection: str, documents: List[Tuple[str, dict]], create: bool = False) -> None:
+        await self.__primary.write_batch(collection, documents, create)
+        documents = [(doc_id, data) for doc_id, data in documents if self.__synced(collection, data)]
+        if documents:
+            await self.__replica.write_batch(collection, documents)
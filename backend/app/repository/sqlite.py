@@ -0,0 +1,175 @@
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.serialization import default
+from app.repository import AlreadyExists, Filter, Repository
+
+INDEXED_FIELDS: Tuple[str, ...] = ('patch', 'version')
+FETCH_SIZE: int = 500
+
+
+def deep_merge(target: dict, data: dict) -> dict:
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            deep_merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+class SQLiteRepository(Repository):
+    def __init__(self, path: str) -> None:
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            'collection TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (collection, id))'
+        )
+        for field in INDEXED_FIELDS:
+            self.__connection.execute(
+                f"CREATE INDEX IF NOT EXISTS documents_{field} ON documents (collection, {self.__path(field)})"
+            )
+
+    @staticmethod
+    def __path(field: str) -> str:
+        if not re.fullmatch(r'[\w\-]+', field):
+            raise ValueError(f"Unsupported field {field}.")
+        return f"json_extract(data, '$.\"{field}\"')"
+
+    @staticmethod
+    def __dump(data: dict) -> str:
+        return json.dumps(data, default=default, ensure_ascii=False, separators=(',', ':'))
+
+    @staticmethod
+    def __select(document: dict, fields: Optional[List[str]]) -> dict:
+        return {field: document[field] for field in fields if field in document} if fields else document
+
+    async def __run(self, func: Callable, *args) -> Any:
+        def locked():
+            with self.__lock:
+                return func(*args)
+
+        return await asyncio.to_thread(locked)
+
+    def __read(self, collection: str, doc_id: str) -> Optional[dict]:
+        row = self.__connection.execute(
+            'SELECT data FROM documents WHERE collection = ? AND id = ?', (collection, doc_id)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def __write(self, collection: str, documents: List[Tuple[str, dict]], create: bool) -> None:
+        statement = 'INSERT' if create else 'INSERT OR REPLACE'
+        try:
+            with self.__connection:
+                self.__connection.execute('BEGIN')
+                self.__connection.executemany(
+                    f"{statement} INTO documents (collection, id, data) VALUES (?, ?, ?)",
+                    [(collection, doc_id, self.__dump(data)) for doc_id, data in documents]
+                )
+        except sqlite3.IntegrityError as e:
+            raise AlreadyExists(collection) from e
+
+    def __swap(self, collection: str, doc_id: str, expected: Optional[dict], data: dict) -> bool:
+        with self.__connection:
+            self.__connection.execute('BEGIN IMMEDIATE')
+            if self.__read(collection, doc_id) != expected:
+                return False
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO documents (collection, id, data) VALUES (?, ?, ?)',
+                (collection, doc_id, self.__dump(data))
+            )
+        return True
+
+    def __update(self, collection: str, doc_id: str, update: Callable[[dict], dict]) -> None:
+        self.__write(collection, [(doc_id, update(self.__read(collection, doc_id) or {}))], False)
+
+    async def create(self, collection: str, doc_id: str, data: dict) -> None:
+        await self.__run(self.__write, collection, [(doc_id, data)], True)
+
+    async def set(self, collection: str, doc_id: str, data: dict, merge: bool = False) -> None:
+        if merge:
+            await self.__run(self.__update, collection, doc_id, lambda document: deep_merge(document, data))
+        else:
+            await self.__run(self.__write, collection, [(doc_id, data)], False)
+
+    async def swap(self, collection: str, doc_id: str, expected: Optional[dict], data: dict) -> bool:
+        return await self.__run(self.__swap, collection, doc_id, expected, data)
+
+    async def append(self, collection: str, doc_id: str, field: str, values: List[Any]) -> None:
+        def update(document: dict) -> dict:
+            *parents, leaf = field.split('.')
+            node = document
+            for part in parents:
+                node = node.setdefault(part, {})
+            items = node.setdefault(leaf, [])
+            items.extend(value for value in dict.fromkeys(values) if value not in items)
+            return document
+
+        await self.__run(self.__update, collection, doc_id, update)
+
+    async def get(self, collection: str, doc_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        document = await self.__run(self.__read, collection, doc_id)
+        return self.__select(document, fields) if document is not None else None
+
+    async def get_many(
+            self,
+            collection: str,
+            doc_ids: Sequence[str],
+            fields: Optional[List[str]] = None
+    ) -> Dict[str, dict]:
+        def read() -> List[tuple]:
+            return self.__connection.execute(
+                f"SELECT id, data FROM documents WHERE collection = ? AND id IN ({', '.join('?' * len(doc_ids))})",
+                (collection, *doc_ids)
+            ).fetchall()
+
+        if not doc_ids:
+            return {}
+        return {doc_id: self.__select(json.loads(data), fields) for doc_id, data in await self.__run(read)}
+
+    async def query(
+            self,
+            collection: str,
+            filters: Sequence[Filter] = (),
+            fields: Optional[List[str]] = None,
+            limit: Optional[int] = None,
+            start_after: Optional[str] = None,
+            ordered: bool = False,
+            order_by: Optional[str] = None,
+            descending: bool = False
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        sql = 'SELECT id, data FROM documents WHERE collection = ?'
+        params: list = [collection]
+        for field, op, value in filters:
+            if op == '==':
+                sql += f" AND {self.__path(field)} = ?"
+                params.append(value)
+            elif op == 'in':
+                sql += f" AND {self.__path(field)} IN ({', '.join('?' * len(value))})"
+                params.extend(value)
+            else:
+                raise ValueError(f"Unsupported operator {op}.")
+        if start_after is not None:
+            sql += ' AND id > ?'
+            params.append(start_after)
+        if order_by is not None:
+            path = self.__path(order_by)
+            sql += f" AND {path} IS NOT NULL ORDER BY {path}{' DESC' if descending else ''}"
+        elif ordered or start_after is not None:
+            sql += ' ORDER BY id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        cursor = await self.__run(self.__connection.execute, sql, params)
+        while rows := await self.__run(cursor.fetchmany, FETCH_SIZE):
+            for doc_id, data in rows:
+                yield doc_id, self.__select(json.loads(data), fields)
+
+    async def write_batch(self, collection: str, documents: List[Tuple[str, dict]], create: bool = False) -> None:
+        await self.__run(self.__write, collection, documents, create)
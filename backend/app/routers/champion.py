@@ -1,8 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
+from app.core.config import settings
+from app.core.projection import resolve
 from app.crud.champion import Champion
+from app.routers.utils import conditional_get, ndjson_response, require_patch
 from app.schema.champion import ChampionCreate, GetChampion, ListChampion
 
 router = APIRouter()
@@ -21,6 +24,26 @@ async def get_champion_list():
 
 
 @router.get('/champions/{patch_version}', response_model=List[GetChampion])
-async def get_champions_by_patch_version(patch_version: str, fields: Optional[List[str]] = Query(None)):
-    result = await Champion(patch_version).get(fields)
+async def get_champions_by_patch_version(
+        request: Request,
+        response: Response,
+        patch_version: str,
+        fields: Optional[List[str]] = Query(None),
+        limit: Optional[int] = Query(None, ge=1, le=settings.API_MAX_PAGE_SIZE),
+        start_after: Optional[str] = Query(None),
+        stream: bool = Query(False)
+):
+    fields = resolve(settings.CHAMPION_COLLECTION, fields)
+    if stream:
+        await require_patch(patch_version)
+        return await ndjson_response(
+            Champion(patch_version).stream(fields, limit, start_after),
+            f"No data found in patch {patch_version}." if start_after is None else None
+        )
+
+    result = await conditional_get(
+        request, response, settings.CHAMPION_COLLECTION, patch_version, fields,
+        lambda: Champion(patch_version).get(fields, limit, start_after), snapshot=True,
+        limit=limit, start_after=start_after
+    )
     return result
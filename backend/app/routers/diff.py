@@ -0,0 +1,28 @@
+import asyncio
+
+from fastapi import APIRouter, Query, Request, Response
+
+from app.core.serialization import dump_json
+from app.crud.diff import Diff
+from app.crud.etag import ETag
+from app.routers.utils import cache_headers, etag_matches, json_response, require_patch
+
+router = APIRouter()
+
+
+@router.get('/diff/{collection}', response_model=dict)
+async def get_diff(
+        request: Request,
+        collection: str,
+        from_patch: str = Query(alias='from'),
+        to_patch: str = Query(alias='to')
+):
+    diff = Diff(collection, from_patch, to_patch)
+    await asyncio.gather(require_patch(from_patch), require_patch(to_patch))
+    result = await diff.get()
+
+    etag = ETag.variant(ETag.compute(result))
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
+
+    return json_response(dump_json(result), etag)
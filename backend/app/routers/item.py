@@ -1,8 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
+from app.core.config import settings
+from app.core.projection import resolve
 from app.crud.item import Item
+from app.routers.utils import conditional_get, ndjson_response, require_patch
 from app.schema.item import ItemSchema, ItemGetSchema
 
 router = APIRouter()
@@ -15,6 +18,26 @@ async def create_items(item: ItemSchema):
 
 
 @router.get('/items/{patch_version}', response_model=List[ItemGetSchema])
-async def get_items(patch_version: str, fields: Optional[List[str]] = Query(None)):
-    result = await Item(patch_version).get(fields)
+async def get_items(
+        request: Request,
+        response: Response,
+        patch_version: str,
+        fields: Optional[List[str]] = Query(None),
+        limit: Optional[int] = Query(None, ge=1, le=settings.API_MAX_PAGE_SIZE),
+        start_after: Optional[str] = Query(None),
+        stream: bool = Query(False)
+):
+    fields = resolve(settings.ITEM_COLLECTION, fields)
+    if stream:
+        await require_patch(patch_version)
+        return await ndjson_response(
+            Item(patch_version).stream(fields, limit, start_after),
+            f"No data found in patch {patch_version}." if start_after is None else None
+        )
+
+    result = await conditional_get(
+        request, response, settings.ITEM_COLLECTION, patch_version, fields,
+        lambda: Item(patch_version).get(fields, limit, start_after), snapshot=True,
+        limit=limit, start_after=start_after
+    )
     return result
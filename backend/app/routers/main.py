@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from .champion import router as champion_router
+from .diff import router as diff_router
 from .item import router as item_router
 from .patch import router as patch_router
 from .perks import router as perks_router
@@ -15,4 +16,5 @@ api_router.include_router(patch_router, tags=['patch'])
 api_router.include_router(perks_router, tags=['perks'])
 api_router.include_router(summoner_spell_router, tags=['summoner_spells'])
 api_router.include_router(shard_router, tags=['shards'])
+api_router.include_router(diff_router, tags=['diff'])
 api_router.include_router(scheduler_router, tags=['jobs'])
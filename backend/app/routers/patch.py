@@ -1,8 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.core.config import settings
+from app.core.projection import resolve
 from app.crud.patch import Patch
+from app.routers.utils import conditional_get, ndjson_response, set_next_cursor
 from app.schema.patch import PatchSchema, GetPatchSchema
 
 router = APIRouter()
@@ -15,8 +18,26 @@ async def create_patch(patch: PatchSchema):
 
 
 @router.get('/patch', response_model=List[GetPatchSchema])
-async def get_all_patch(fields: Optional[List[str]] = Query(None)):
-    result = await Patch.get_all_patch(fields)
+async def get_all_patch(
+        response: Response,
+        versions: Optional[List[str]] = Query(None),
+        fields: Optional[List[str]] = Query(None),
+        limit: Optional[int] = Query(None, ge=1, le=settings.API_MAX_PAGE_SIZE),
+        start_after: Optional[str] = Query(None),
+        stream: bool = Query(False)
+):
+    fields = resolve(settings.PATCH_COLLECTION, fields)
+    if versions:
+        versions = [version.strip() for value in versions for version in value.split(',') if version.strip()]
+        if len(versions) > settings.API_MAX_PAGE_SIZE:
+            raise HTTPException(400, f"At most {settings.API_MAX_PAGE_SIZE} versions can be requested.")
+        return await Patch(versions).get(fields)
+
+    if stream:
+        return await ndjson_response(Patch.stream_all_patch(fields, limit, start_after))
+
+    result = await Patch.get_all_patch(fields, limit, start_after)
+    set_next_cursor(response, result, limit)
     return result
 
 
@@ -27,6 +48,9 @@ async def get_latest_patch():
 
 
 @router.get('/patch/{version}', response_model=GetPatchSchema)
-async def get_patch(version: str):
-    result = await Patch(version).get()
-    return result[0]
+async def get_patch(request: Request, response: Response, version: str):
+    async def get_result() -> dict:
+        return (await Patch(version).get())[0]
+
+    result = await conditional_get(request, response, settings.PATCH_COLLECTION, version, None, get_result)
+    return result
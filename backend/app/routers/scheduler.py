@@ -1,6 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
-from app.scheduler import scheduler
+from app.core.config import settings
+from app.core.job_scripts.patch_release import release_progress, retry_stage
+from app.scheduler import leader, scheduler
 
 router = APIRouter()
 
@@ -8,3 +10,26 @@ router = APIRouter()
 @router.get("/jobs")
 def get_jobs():
     return scheduler.list_jobs()
+
+
+@router.get("/jobs/leader")
+def get_leader():
+    return {
+        'id': leader.id,
+        'leader': leader.is_leader,
+        'election': settings.LEADER_ELECTION,
+    }
+
+
+@router.get("/jobs/releases/{version}/stages")
+def get_release_stages(version: str):
+    progress = release_progress(version)
+    if progress is None:
+        raise HTTPException(400, f"No release run found for patch {version}.")
+    return progress
+
+
+@router.post("/jobs/releases/{version}/stages/{stage}/retry")
+async def retry_release_stage(version: str, stage: str):
+    result = await retry_stage(version, stage)
+    return result
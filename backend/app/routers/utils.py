@@ -0,0 +1,144 @@
+import gzip
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.cache import read_cache
+from app.core.config import settings
+from app.core.serialization import dump_json
+from app.crud.etag import ETag
+from app.crud.patch import Patch
+from app.crud.snapshot import Snapshot
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates
+
+
+def accepted_encoding(request: Request) -> Optional[str]:
+    accepted: set = set()
+    for value in request.headers.get('accept-encoding', '').split(','):
+        encoding, _, quality = value.partition(';q=')
+        try:
+            if float(quality or 1) > 0:
+                accepted.add(encoding.strip().lower())
+        except ValueError:
+            continue
+
+    return next((encoding for encoding in Snapshot.encodings() if encoding in accepted), None)
+
+
+def cache_headers(etag: str) -> dict:
+    return {
+        'ETag': etag,
+        'Cache-Control': settings.API_CACHE_CONTROL,
+    }
+
+
+def next_cursor(result: Any, limit: Optional[int]) -> Optional[str]:
+    if limit is not None and len(result) == limit:
+        return result[-1]['id']
+    return None
+
+
+async def require_patch(version: str) -> None:
+    await Patch(version).get(['version'])
+
+
+def set_next_cursor(response: Response, result: List[dict], limit: Optional[int]) -> None:
+    cursor = next_cursor(result, limit)
+    if cursor is not None:
+        response.headers['X-Next-Cursor'] = cursor
+
+
+def json_response(content: bytes, etag: str, cursor: Optional[str] = None) -> Response:
+    headers = cache_headers(etag)
+    if cursor is not None:
+        headers['X-Next-Cursor'] = cursor
+    return Response(content, media_type='application/json', headers=headers)
+
+
+async def ndjson_response(documents: AsyncIterator[dict], empty_message: Optional[str] = None) -> StreamingResponse:
+    try:
+        first: Optional[dict] = await anext(documents)
+    except StopAsyncIteration:
+        if empty_message is not None:
+            raise HTTPException(400, empty_message)
+        first = None
+
+    async def lines() -> AsyncIterator[str]:
+        if first is None:
+            return
+
+        yield dump_json(first) + b'\n'
+        async for document in documents:
+            yield dump_json(document) + b'\n'
+
+    return StreamingResponse(lines(), media_type='application/x-ndjson')
+
+
+async def conditional_get(
+        request: Request,
+        response: Response,
+        collection: str,
+        patch: str,
+        fields: Optional[List[str]],
+        get_result: Callable[[], Awaitable[Any]],
+        snapshot: bool = False,
+        limit: Optional[int] = None,
+        start_after: Optional[str] = None
+) -> Any:
+    if collection != settings.PATCH_COLLECTION:
+        await require_patch(patch)
+
+    computed_key = read_cache.key(collection, [patch], fields) + ('etag', limit, start_after)
+    etag = await ETag.get(collection, patch)
+    if etag is not None:
+        etag = ETag.variant(etag, fields, limit, start_after)
+    else:
+        etag = read_cache.get(computed_key)
+
+    if snapshot and etag is not None and not fields and limit is None and start_after is None:
+        encoding = accepted_encoding(request)
+        headers = {**cache_headers(ETag.encoded(etag, encoding)), 'Vary': 'Accept-Encoding'}
+        if etag_matches(request, headers['ETag']):
+            return Response(status_code=304, headers=headers)
+
+        content = await Snapshot.get(collection, patch, encoding or 'gzip')
+        if content is not None:
+            if encoding is not None:
+                headers['Content-Encoding'] = encoding
+            else:
+                content = gzip.decompress(content)
+            return Response(content, media_type='application/json', headers=headers)
+
+    if etag is not None and etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
+
+    if settings.API_FAST_JSON and etag is not None:
+        cached = read_cache.get(read_cache.key(collection, [patch]) + ('body', etag))
+        if cached is not None:
+            return json_response(*cached)
+
+    result = await get_result()
+
+    if etag is None:
+        etag = ETag.variant(ETag.compute(result))
+        read_cache.set(computed_key, etag, len(etag))
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=cache_headers(etag))
+
+    if not settings.API_FAST_JSON:
+        response.headers.update(cache_headers(etag))
+        set_next_cursor(response, result, limit)
+        return result
+
+    body = (dump_json(result), etag, next_cursor(result, limit))
+    read_cache.set(read_cache.key(collection, [patch]) + ('body', etag), body, len(body[0]))
+    return json_response(*body)
@@ -1,3 +1,5 @@
+from app.core.leader import Leader
 from app.core.scheduler import Scheduler
 
 scheduler = Scheduler()
+leader = Leader('scheduler')
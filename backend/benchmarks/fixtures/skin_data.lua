@@ -0,0 +1,121 @@
+-- <pre>
+return {
+    ["Aatrox"] = {
+        ["id"]    = 266,
+        ["skins"] = {
+            ["Original Aatrox"] = {
+                ["id"]           = 0,
+                ["availability"] = "Available",
+                ["release"]      = "2013-06-13",
+                ["cost"]         = 4800,
+                ["voiceactor"]   = {"Jason Spisak"},
+                ["splashartist"] = "Riot Games",
+            },
+            ["Justicar Aatrox"] = {
+                ["id"]           = 1,
+                ["availability"] = "Available",
+                ["release"]      = "2013-06-13",
+                ["cost"]         = 975,
+                ["set"]          = {"Justicar"},
+                ["splashartist"] = "Chris Campbell",
+                ["lore"]         = "The Justicars were the sworn protectors of the \"old\" law.",
+            },
+            ["Blood Moon Aatrox"] = {
+                ["id"]           = 7,
+                ["availability"] = "Available",
+                ["release"]      = "2020-01-23",
+                ["cost"]         = 1350,
+                ["set"]          = {"Blood Moon"},
+                ["neweffects"]   = true,
+                ["newrecall"]    = true,
+                ["chromas"]      = {
+                    ["Obsidian"] = {
+                        ["id"]           = 266008,
+                        ["availability"] = "Available",
+                    },
+                    ["Ruby"] = {
+                        ["id"]           = 266009,
+                        ["availability"] = "Legacy",
+                        ["distribution"] = nil,
+                    },
+                },
+            },
+        },
+    },
+    ["Ahri"] = {
+        ["id"]    = 103,
+        ["skins"] = {
+            ["Original Ahri"] = {
+                ["id"]           = 0,
+                ["availability"] = "Available",
+                ["release"]      = "2011-12-14",
+                ["cost"]         = 3150,
+                ["voiceactor"]   = {"Laura Post", "Kira Buckland"},
+            },
+            ["Dynasty Ahri"] = {
+                ["id"]           = 1,
+                ["availability"] = "Legacy",
+                ["release"]      = "2011-12-14", -- Released with the champion
+                ["cost"]         = 1820,
+                ["looteligible"] = false,
+                ["splashartist"] = nil,
+            },
+            ["Spirit Blossom Ahri"] = {
+                ["id"]           = 27,
+                ["availability"] = "Available",
+                ["release"]      = "2020-07-23",
+                ["cost"]         = 1350,
+                ["set"]          = {"Spirit Blossom", "Spirit Blossom Festival"},
+                ["formatname"]   = "Spirit Blossom Ahri",
+                ["chromas"]      = {
+                    ["Amethyst"] = {
+                        ["id"]           = 103028,
+                        ["availability"] = "Available",
+                    },
+                },
+            },
+        },
+    },
+    ["Kai'Sa"] = {
+        ["id"]    = 145,
+        ["skins"] = {
+            ["Original Kai'Sa"] = {
+                ["id"]           = 0,
+                ["availability"] = "Available",
+                ["release"]      = "2018-03-07",
+                ["cost"]         = 6300,
+                ["voiceactor"]   = {"Sarah Anne Williams"},
+            },
+            ["K/DA Kai'Sa"] = {
+                ["id"]           = 14,
+                ["availability"] = "Available",
+                ["release"]      = "2018-11-03",
+                ["cost"]         = 1350,
+                ["set"]          = {"K/DA"},
+                ["lore"]         = "Kai'Sa's dance moves are \"out of this world\".",
+                ["variant"]      = "K/DA ALL OUT Kai'Sa",
+            },
+        },
+    },
+    ["Nunu & Willump"] = {
+        ["id"]    = 20,
+        ["skins"] = {
+            ["Original Nunu & Willump"] = {
+                ["id"]           = 0,
+                ["availability"] = "Available",
+                ["release"]      = "2009-02-21",
+                ["cost"]         = 450,
+                ["voiceactor"]   = {"Griffin Puatu", "Carlos Alazraqui"},
+            },
+            ["Sasquatch Nunu & Willump"] = {
+                ["id"]           = 1,
+                ["availability"] = "Legacy",
+                ["release"]      = "2009-12-15",
+                ["cost"]         = 520,
+                ["filter"]       = 1.5,
+            },
+        },
+    },
+}
+-- </pre>
+-- [[Category:Lua]]
@@ -0,0 +1,89 @@
+import argparse
+import hashlib
+import json
+import re
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from app.core.job_scripts import lua
+from app.core.job_scripts.parser import parse_page
+
+SKIN_DATA_URL: str = 'https://leagueoflegends.fandom.com/wiki/Module:SkinData/data'
+FIXTURE: Path = Path(__file__).parent / 'fixtures' / 'skin_data.lua'
+
+
+def regex_loads(code_text: str) -> dict:
+    code_text = re.sub(r'-- <pre>', '', code_text)
+    code_text = re.sub(r'return\s*', '', code_text)
+    code_text = re.sub(r'\["', '"', code_text)
+    code_text = re.sub(r'"]', '"', code_text)
+    code_text = re.sub(r'=', ':', code_text)
+    code_text = re.sub(r'\{"', '["', code_text)
+    code_text = re.sub(r'"}', '"]', code_text)
+    code_text = re.sub(r'nil', 'null', code_text)
+    code_text = re.sub(r',\s*([]}])', r'\1', code_text)
+    code_text = re.sub(r',\s*--.*$', ',', code_text, flags=re.MULTILINE)
+    code_text = re.sub(r'--\s</pre>.*$', '', code_text, flags=re.DOTALL)
+    return json.loads(code_text.strip())
+
+
+def lua_loads(code_text: str) -> dict:
+    return dict(lua.iter_entries(code_text))
+
+
+def load_code(cache_dir: Path) -> str:
+    index = cache_dir / 'index' / f"{hashlib.sha256(SKIN_DATA_URL.encode()).hexdigest()}.json"
+    if not index.exists():
+        print(f"{SKIN_DATA_URL} is not in {cache_dir}, using {FIXTURE.name}.")
+        return FIXTURE.read_text()
+
+    digest = json.loads(index.read_text())['body']
+    page = parse_page((cache_dir / 'bodies' / digest[:2] / digest).read_bytes(), 'module')
+    return page.find('pre', class_='mw-code mw-script', dir='ltr').get_text()
+
+
+def measure(func: Callable[[str], dict], code_text: str, repeat: int) -> tuple:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(code_text)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = func(code_text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the Lua table parser with the legacy regex conversion.')
+    parser.add_argument('--cache-dir', default='.http_cache', help='HTTP cache directory recorded by patch_release.')
+    parser.add_argument('--file', help='Read the raw Lua module from this file instead of the HTTP cache.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    code_text = Path(args.file).read_text() if args.file else load_code(Path(args.cache_dir))
+    print(f"Module size: {len(code_text) / 1024:.0f} KiB")
+
+    results = {}
+    for name, func in (('regex', regex_loads), ('lua', lua_loads)):
+        try:
+            seconds, peak, results[name] = measure(func, code_text, args.repeat)
+        except ValueError as e:
+            print(f"{name:<6} failed: {e}")
+            continue
+        print(f"{name:<6} {seconds * 1000:>9.1f} ms {peak / 1024 / 1024:>9.1f} MiB peak")
+
+    if len(results) == 2:
+        print(f"Same result: {results['regex'] == results['lua']}")
+
+    if 'lua' not in results or len(results) == 2 and results['regex'] != results['lua']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
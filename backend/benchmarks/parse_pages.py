@@ -0,0 +1,108 @@
+import argparse
+import json
+import re
+import time
+import tracemalloc
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.core.job_scripts.parser import TARGETS
+
+FIXTURES: Path = Path(__file__).parent / 'fixtures' / 'pages'
+
+EXTRACTORS: List[Tuple[str, str, str]] = [
+    ('spell', r'/wiki/Template:Data_[^/]+/.+', 'ability'),
+    ('info_stats', r'/wiki/Template:Data_[^/]+$', 'data_table'),
+    ('skins', r'/wiki/Module:SkinData/data$', 'module'),
+    ('strategy', r'/Strategy$', 'article'),
+    ('patch_notes', r'/patch-[\d-]+-notes/?$', 'patch_notes'),
+    ('bio', r'leagueoflegends\.fandom\.com/wiki/', 'article'),
+]
+
+
+def classify(url: str) -> Optional[Tuple[str, str]]:
+    for name, pattern, target in EXTRACTORS:
+        if re.search(pattern, url):
+            return name, target
+    return None
+
+
+def load_pages(cache_dir: Path) -> Dict[str, List[Tuple[str, bytes]]]:
+    pages: Dict[str, List[Tuple[str, bytes]]] = {}
+    for index in sorted((cache_dir / 'index').glob('*.json')):
+        entry = json.loads(index.read_text())
+        extractor = classify(entry['url'])
+        if extractor is None:
+            continue
+        body = (cache_dir / 'bodies' / entry['body'][:2] / entry['body']).read_bytes()
+        pages.setdefault(extractor[0], []).append((extractor[1], body))
+    return pages
+
+
+def load_fixtures() -> Dict[str, List[Tuple[str, bytes]]]:
+    targets = {name: target for name, _, target in EXTRACTORS}
+    return {path.stem: [(targets[path.stem], path.read_bytes())] for path in sorted(FIXTURES.glob('*.html'))}
+
+
+def targeted_matches(body: bytes, target: str, backend: str) -> bool:
+    full = ' '.join(BeautifulSoup(body, backend).get_text().split())
+    targeted = ' '.join(BeautifulSoup(body, backend, parse_only=TARGETS[target]).get_text().split())
+    return bool(targeted) and targeted in full
+
+
+def measure(pages: List[Tuple[str, bytes]], backend: str, targeted: bool, repeat: int) -> Tuple[float, int]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for target, body in pages:
+            BeautifulSoup(body, backend, parse_only=TARGETS[target] if targeted else None)
+        best = min(best, time.perf_counter() - start)
+
+    peak = 0
+    for target, body in pages:
+        tracemalloc.start()
+        soup = BeautifulSoup(body, backend, parse_only=TARGETS[target] if targeted else None)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del soup
+
+    return best / len(pages), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare HTML parser backends over recorded scraper pages.')
+    parser.add_argument('--cache-dir', default='.http_cache', help='HTTP cache directory recorded by patch_release.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cache_dir = Path(args.cache_dir)
+    pages = load_pages(cache_dir) if (cache_dir / 'index').is_dir() else {}
+    if not pages:
+        print(f"No fandom or patch notes pages found in {args.cache_dir}, using {FIXTURES}.")
+        pages = load_fixtures()
+
+    backends = ['html.parser'] + (['lxml'] if find_spec('lxml') is not None else [])
+
+    print(f"{'extractor':<12} {'pages':>5} {'backend':<12} {'mode':<9} {'ms/page':>9} {'peak KiB':>9}")
+    for extractor, extractor_pages in pages.items():
+        for backend in backends:
+            for targeted in (False, True):
+                seconds, peak = measure(extractor_pages, backend, targeted, args.repeat)
+                print(
+                    f"{extractor:<12} {len(extractor_pages):>5} {backend:<12} "
+                    f"{'targeted' if targeted else 'full':<9} {seconds * 1000:>9.2f} {peak / 1024:>9.0f}"
+                )
+
+    mismatches = [
+        f"{extractor} ({backend})" for extractor, extractor_pages in pages.items() for backend in backends
+        if not all(targeted_matches(body, target, backend) for target, body in extractor_pages)
+    ]
+    if mismatches:
+        raise SystemExit(f"Targeted parsing lost content for: {', '.join(mismatches)}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.serialization import dump_json, orjson
+from app.schema.champion import GetChampion
+
+STATS: tuple = (
+    'health', 'health_regen', 'mana', 'mana_regen', 'move_speed', 'armor', 'magic_resistance', 'attack_range', 'crit',
+    'attack_damage', 'attack_speed',
+)
+SPELL_FIELDS: tuple = (
+    'cooldown', 'range', 'cost', 'magic_damage', 'physical_damage', 'total_damage', 'slow', 'bonus_movement_speed',
+    'bonus_attack_speed', 'shield_strength', 'heal', 'stun_duration', 'root_duration', 'effect_radius', 'width',
+    'speed', 'target_range', 'duration', 'bonus_armor', 'bonus_magic_resistance', 'minion_damage', 'monster_damage',
+)
+
+
+def ranks(rng: random.Random, size: int = 5) -> List[float]:
+    return [round(rng.uniform(10, 500), 2) for _ in range(size)]
+
+
+def champion(rng: random.Random, index: int) -> dict:
+    return {
+        'id': f"champion-{index}",
+        'champ_id': index,
+        'patch': '14.20',
+        'name': f"Champion {index}",
+        'title': 'the Benchmark',
+        'icon': f"https://example.com/champion/{index}/icon.png",
+        'resource': 'Mana',
+        'release_date': datetime(2009, 2, 21) + timedelta(days=index * 30),
+        'release_patch': 'V1.0.0.152',
+        'role': ['Mage', 'Support'],
+        'adaptive_type': 'Magic',
+        'range_type': 'Ranged',
+        'blue_essence': 4800,
+        'rp': 880,
+        'ally_tips': [' '.join(['tip'] * 30)] * 3,
+        'enemy_tips': [' '.join(['tip'] * 30)] * 3,
+        'tactical': {key: rng.randint(1, 3) for key in ('damage', 'toughness', 'control', 'mobility', 'utility',
+                                                        'difficulty')},
+        'stats': {
+            **{key: {'flat': rng.uniform(0, 700), 'per_level': rng.uniform(0, 100)} for key in STATS},
+            'missile_speed': 1200.0, 'attack_delay_offset': -0.1, 'acquisition_radius': 800.0,
+            'selection_radius': 120.0, 'gameplay_radius': 65.0, 'pathing_radius': 35.0, 'aram_dmg_dealt': 1.0,
+            'aram_dmg_taken': 1.0, 'aram_healing': None, 'aram_shielding': None, 'urf_dmg_dealt': 1.0,
+            'urf_dmg_taken': 1.0, 'urf_healing': None, 'urf_shielding': None,
+        },
+        'spells': [
+            {
+                'key': key,
+                'name': f"Spell {key}",
+                'description': ' '.join(['description'] * 60),
+                'icon': f"https://example.com/champion/{index}/{key}.png",
+                'max_rank': 5,
+                'explanation': [' '.join(['explanation'] * 40)] * 4,
+                **{field: ranks(rng) for field in rng.sample(SPELL_FIELDS, 14)},
+            }
+            for key in ('q', 'w', 'e', 'r')
+        ],
+        'passive': {
+            'name': 'Passive',
+            'description': ' '.join(['passive'] * 60),
+            'icon': f"https://example.com/champion/{index}/passive.png",
+            'static_cooldown': ranks(rng, 18),
+        },
+        'skins': [
+            {
+                'id': index * 1000 + skin,
+                'is_base': skin == 0,
+                'name': f"Skin {skin}",
+                'splash': f"https://example.com/champion/{index}/skins/{skin}/splash.jpg",
+                'icon': f"https://example.com/champion/{index}/skins/{skin}/icon.jpg",
+                'chroma_icon': None,
+                'chromas': [
+                    {'id': str(chroma), 'name': f"Chroma {chroma}", 'icon': f"https://example.com/{chroma}.png"}
+                    for chroma in range(rng.randint(0, 8))
+                ],
+                'cost': 1350,
+                'release_date': datetime(2012, 1, 1) + timedelta(days=skin * 90),
+                'voice_actor': ['Someone'],
+                'splash_artist': ['Someone Else'],
+                'lore': ' '.join(['lore'] * 80),
+            }
+            for skin in range(rng.randint(5, 20))
+        ],
+        'biography': [' '.join(['biography'] * 120)] * 6,
+    }
+
+
+def load_payload(path: str | None, count: int) -> List[dict]:
+    if path:
+        return json.loads(Path(path).read_text())
+
+    rng = random.Random(0)
+    return [champion(rng, index) for index in range(count)]
+
+
+def measure(func: Callable[[List[dict]], Any], payload: List[dict], repeat: int) -> tuple:
+    func(payload)
+
+    start = time.process_time()
+    for _ in range(repeat):
+        body = func(payload)
+    return (time.process_time() - start) / repeat, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare response_model serialization with the raw JSON path.')
+    parser.add_argument('--payload', help='JSON list of champion documents, e.g. a saved GET /champions response.')
+    parser.add_argument('--count', type=int, default=170, help='Number of synthetic champions when no payload.')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    payload = load_payload(args.payload, args.count)
+    field = create_model_field('Response_get_champions', List[GetChampion], mode='serialization')
+
+    def response_model(documents: List[dict]) -> bytes:
+        content = asyncio.run(serialize_response(field=field, response_content=documents))
+        return JSONResponse(content).body
+
+    print(f"Champions: {len(payload)}, encoder: {'orjson' if orjson is not None else 'json'}")
+    results = {}
+    for name, func in (('response_model', response_model), ('dump_json', dump_json)):
+        results[name], size = measure(func, payload, args.repeat)
+        print(f"{name:<15} {results[name] * 1000:>9.1f} ms CPU/request {size / 1024 / 1024:>7.2f} MiB")
+
+    print(f"Speedup: {results['response_model'] / results['dump_json']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()